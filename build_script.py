@@ -1,3 +1,6 @@
+import os
+import sys
+import tempfile
 import subprocess
 
 def run_command(command):
@@ -8,8 +11,26 @@ def run_command(command):
         print(f"\nError executing command: {e}")
         return False
 
+# Prebuilt app index bundled under assets for offline first start. Built from a fresh
+# GetAppList in a throwaway database, so no steam_data.db ends up in the packaged assets.
+def build_snapshot():
+    try:
+        from src.core.appID_finder import AppIndex
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index = AppIndex(os.path.join(temp_dir, "steam_data.db"), snapshot_file=None)
+            try:
+                count = index.export_snapshot()
+            finally:
+                index.close()
+        print(f"App index snapshot built with {count} apps.")
+        return True
+    except Exception as e:
+        print(f"\nSkipping app index snapshot: {e}")
+        return False
+
 def main():
     print("Starting compilation process...")
+    build_snapshot()
 
     # Nuitka compilation parameters
     nuitka_params = [
@@ -43,8 +64,17 @@ def main():
     modules_to_include = [
         "src.core.achievements",
         "src.core.appID_finder",
+        "src.core.appSnapshot",
         "src.core.dlc_gen",
+        "src.core.dllFinder",
+        "src.core.emuManifest",
+        "src.core.fileDeploy",
         "src.core.goldberg_gen",
+        "src.core.htmlParser",
+        "src.core.httpClient",
+        "src.core.iconCache",
+        "src.core.interfaceScanner",
+        "src.core.outputManifest",
         "src.core.setupEmu",
         "src.core.threadManager",
         "src.gui.GSE_Generator"
@@ -70,4 +100,7 @@ def main():
     input("Press Enter to exit...")
 
 if __name__ == "__main__":
+    # Used by the release workflow, which packages assets/ without compiling
+    if "--snapshot" in sys.argv:
+        sys.exit(0 if build_snapshot() else 1)
     main()
\ No newline at end of file
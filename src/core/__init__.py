@@ -1,17 +1,35 @@
 # src/core/__init__.py
 
-from .achievements import fetch_from_steamcommunity, fetch_from_steamdb
-from .appID_finder import get_steam_app_by_id, get_steam_app_by_name
+from .achievements import fetch_achievements, fetch_from_steamcommunity, fetch_from_steamdb
+from .appID_finder import AppIndex, get_app_index, refresh_app_index, resolve_apps, get_steam_app_by_id, get_steam_app_by_name
+from .appSnapshot import read_snapshot, write_snapshot
 from .dlc_gen import fetch_dlc, create_dlc_config
-from .goldberg_gen import generate_emu
+from .dllFinder import find_steam_dlls
+from .emuManifest import EmuManifest, get_emu_manifest
+from .fileDeploy import deploy_file, deploy_tree
+from .goldberg_gen import generate_emu, generate_emu_all
+from .htmlParser import parse_html
+from .httpClient import pooled_session, http_get, close_sessions
+from .iconCache import IconCache
+from .interfaceScanner import get_interfaces
+from .outputManifest import OutputManifest
 from .setupEmu import download_goldberg, extract_archive
 from .threadManager import ThreadManager
 
 __all__ = [
-    "fetch_from_steamcommunity", "fetch_from_steamdb",
-    "get_steam_app_by_id", "get_steam_app_by_name",
+    "fetch_achievements", "fetch_from_steamcommunity", "fetch_from_steamdb",
+    "AppIndex", "get_app_index", "refresh_app_index", "resolve_apps", "get_steam_app_by_id", "get_steam_app_by_name",
+    "read_snapshot", "write_snapshot",
     "fetch_dlc", "create_dlc_config",
-    "generate_emu",
+    "find_steam_dlls",
+    "EmuManifest", "get_emu_manifest",
+    "deploy_file", "deploy_tree",
+    "generate_emu", "generate_emu_all",
+    "parse_html",
+    "pooled_session", "http_get", "close_sessions",
+    "IconCache",
+    "get_interfaces",
+    "OutputManifest",
     "download_goldberg", "extract_archive",
     "ThreadManager"
 ]
@@ -1,103 +1,204 @@
 import os
 import json
+import hashlib
+import asyncio
+import itertools
+import threading
 import concurrent.futures
-from bs4 import BeautifulSoup
 from curl_cffi import requests
-from typing import List, Dict, Set, Optional
-
-def configure_base_session(session: requests.Session):
-    session.cipher = ("TLS_AES_128_GCM_SHA256:TLS_AES_256_GCM_SHA384:TLS_CHACHA20_POLY1305_SHA256:TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384:TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256:TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384:TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256:TLS_RSA_WITH_AES_256_GCM_SHA384:TLS_RSA_WITH_AES_128_GCM_SHA256:TLS_RSA_WITH_AES_256_CBC_SHA:TLS_RSA_WITH_AES_128_CBC_SHA:TLS_ECDHE_ECDSA_WITH_3DES_EDE_CBC_SHA:TLS_ECDHE_RSA_WITH_3DES_EDE_CBC_SHA:TLS_RSA_WITH_3DES_EDE_CBC_SHA")
-    session.curve = "X25519:P-256:P-384:P-521"
-    session.sign_algo = ("ecdsa_secp256r1_sha256,rsa_pss_rsae_sha256,rsa_pkcs1_sha256,ecdsa_secp384r1_sha384,ecdsa_sha1,rsa_pss_rsae_sha384,rsa_pss_rsae_sha384,rsa_pkcs1_sha384,rsa_pss_rsae_sha512,rsa_pkcs1_sha512,rsa_pkcs1_sha1")
-    return session
-
-def create_session(session_type: str = "steam", appid: Optional[str] = None) -> requests.Session:
-    if session_type == "steamdb":            
-        headers = { "authority": "steamdb.info", "accept": "text/html", "accept-encoding": "gzip, deflate, br, zstd", "accept-language": "en", "dnt": "1", "priority": "u=1, i", "referer": f"https://steamdb.info/app/{appid}/stats/", "sec-ch-ua": '"Not A(Brand";v="8", "Chromium";v="132", "Google Chrome";v="132"', "sec-ch-ua-mobile": "?0", "sec-ch-ua-platform": '"Windows"', "sec-fetch-dest": "empty", "sec-fetch-mode": "cors", "sec-fetch-site": "same-origin", "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36", "x-requested-with": "XMLHttpRequest" }
-        session = requests.Session(impersonate="chrome110", headers=headers, timeout=30)
-    else:  # steam
-        headers = { "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.5 Safari/605.1.15", "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8", "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8", "Accept-Encoding": "gzip, deflate, br" }
-        session = requests.Session(impersonate="safari15_5", headers=headers, timeout=30)
-    
-    return configure_base_session(session)
-
-def mk_request(url: str, session: requests.Session) -> requests.Response:
+from collections import defaultdict
+from urllib.parse import urlsplit
+from typing import List, Dict, Callable, Iterable, Iterator, Optional
+from .httpClient import STEAM_API_URL, pooled_session, http_get, create_async_session, download_file_async
+from .iconCache import IconCache
+from .outputManifest import OutputManifest, hash_entry
+from .htmlParser import parse_html
+
+IMAGE_CONCURRENCY = 32
+IMAGE_HOST_CONNECTIONS = 16
+IMAGE_OK_STATUSES = {"ok", "cached", "revalidated"}
+HEDGE_DELAY = 3.0
+
+# Steam language names, as taken by the Web API "l" and Community "?l=" parameters
+DEFAULT_LANGUAGE = "english"
+LOCALIZED_SOURCES = ("schema", "steamcommunity")
+
+def mk_request(url: str, session: requests.Session, headers: Optional[Dict] = None) -> requests.Response:
     try:
-        return session.get(url, timeout=30)
+        return session.get(url, headers=headers, timeout=30)
     except Exception as e:
         raise RuntimeError(f"Failed to fetch URL {url}: {str(e)}")
 
-def download_one_image(args) -> bool:
-    image_url, image_path, headers = args
+async def download_one_image(session: requests.AsyncSession, cache: IconCache, image_url: str, image_path: str, limit: asyncio.Semaphore, host_limit: asyncio.Semaphore) -> str:
+    name = os.path.basename(image_path)
+    status = "cached"
+
+    if not cache.is_fresh(name):
+        # Host slot first, so tasks waiting on a busy host don't hold global slots other hosts could use
+        async with host_limit, limit:
+            try:
+                response = await download_file_async(session, image_url, cache.path(name), headers=cache.conditional_headers(name))
+            except Exception as e:
+                return f"error: {e}"
+
+        if response.status_code not in (200, 206, 304):
+            return f"http {response.status_code}"
+        cache.update(name, response.headers)
+        status = "revalidated" if response.status_code == 304 else "ok"
+
     try:
-        session = create_session("steam")
-        response = mk_request(image_url, session)
-        if response.status_code == 200:
-            with open(image_path, 'wb') as img_file:
-                img_file.write(response.content)
-            session.close()
-            return True
-        session.close()
-    except Exception:
-        return False
-    return False
-
-def download_images(appid: str, achievements: List[Dict], session: requests.Session, silent: bool = False):
-    image_folder = "images"
-    os.makedirs(image_folder, exist_ok=True)
-    
-    download_tasks = []
-    downloaded_images: Set[str] = set()
-    headers = session.headers
-    
-    total_images = 0
-    for achievement in achievements:
-        for key in ['icon', 'icongray']:
-            icon_name = achievement.get(key)
-            if icon_name and icon_name.split('/')[-1] not in downloaded_images:
-                total_images += 1
-                downloaded_images.add(icon_name.split('/')[-1])
-    
-    downloaded_images.clear()
-    
-    for achievement in achievements:
-        for key in ['icon', 'icongray']:
-            icon_name = achievement.get(key)
-            if not icon_name:
-                continue
+        cache.link_into(name, image_path)
+    except OSError as e:
+        return f"error: {e}"
+    return status
 
-            image_file_name = icon_name.split('/')[-1]
-            if image_file_name in downloaded_images:
-                continue
+# Icon downloads on a background event loop, fed while achievements are still being parsed
+class IconPipeline:
+    def __init__(self, appid: str, output_dir: str = ".", concurrency: int = IMAGE_CONCURRENCY, per_host: int = IMAGE_HOST_CONNECTIONS):
+        self.appid = appid
+        self.image_folder = os.path.join(output_dir, "images")
+        os.makedirs(self.image_folder, exist_ok=True)
+
+        self.cache = IconCache()
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.futures: Dict[str, concurrent.futures.Future] = {}
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._open(), self.loop).result()
+
+    async def _open(self):
+        self.limit = asyncio.Semaphore(self.concurrency)
+        self.host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        self.session = create_async_session("steam", max_clients=self.concurrency)
+
+    async def _download(self, image_url: str, image_path: str) -> str:
+        host_limit = self.host_limits[urlsplit(image_url).netloc]
+        return await download_one_image(self.session, self.cache, image_url, image_path, self.limit, host_limit)
+
+    # Queue an icon ("images/<hash>.jpg" or a bare file name), duplicates are ignored
+    def submit(self, icon_name: Optional[str]):
+        image_file_name = (icon_name or "").split('/')[-1]
+        if not image_file_name or image_file_name in self.futures:
+            return
+
+        image_url = f"https://cdn.fastly.steamstatic.com/steamcommunity/public/images/apps/{self.appid}/{image_file_name}"
+        image_path = os.path.join(self.image_folder, image_file_name)
+        self.futures[image_file_name] = asyncio.run_coroutine_threadsafe(self._download(image_url, image_path), self.loop)
+
+    # Wait for every queued icon, returns a status per file
+    def close(self, silent: bool = False) -> Dict[str, str]:
+        try:
+            statuses = {name: future.result() for name, future in self.futures.items()}
+        finally:
+            asyncio.run_coroutine_threadsafe(self.session.close(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            self.cache.save()
+
+        if silent or not statuses:
+            return statuses
+
+        failed = {name: status for name, status in statuses.items() if status not in IMAGE_OK_STATUSES}
+        downloaded = sum(1 for status in statuses.values() if status == "ok")
+        print(f"Images: {downloaded} downloaded, {len(statuses) - len(failed) - downloaded} from cache, {len(failed)} failed")
+        for name, status in failed.items():
+            print(f"Failed to download {name}: {status}")
+        return statuses
+
+# Writes the same layout as json.dump(achievements, indent=2), one entry at a time
+class AchievementWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.file = open(self.tmp_path, 'w', encoding='utf-8')
+        self.hash = hashlib.sha256()
+        self.count = 0
+
+    @property
+    def digest(self) -> str:
+        return self.hash.hexdigest()
+
+    def _write(self, text: str):
+        self.file.write(text)
+        self.hash.update(text.encode('utf-8'))
+
+    def write(self, achievement: Dict):
+        entry = json.dumps(achievement, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+        self._write(("[\n  " if self.count == 0 else ",\n  ") + entry)
+        self.count += 1
+
+    # Returns False when the content matches previous_digest and the existing file was left untouched
+    def close(self, previous_digest: Optional[str] = None) -> bool:
+        self._write("\n]" if self.count else "[]")
+        self.file.close()
+        if self.digest == previous_digest and os.path.exists(self.path):
+            os.remove(self.tmp_path)
+            return False
+        os.replace(self.tmp_path, self.path)
+        return True
+
+    def abort(self):
+        self.file.close()
+        os.remove(self.tmp_path)
+
+# Streams parsed achievements into achievements.json while their icons download.
+# The output manifest of the previous run limits the work to what changed since.
+# progress receives a message about icons that failed to download, even when silent.
+def save_achievements(appid: str, achievements: Iterable[Dict], output_dir: str = ".", silent: bool = False, source: Optional[str] = None, concurrency: int = IMAGE_CONCURRENCY, per_host: int = IMAGE_HOST_CONNECTIONS, progress: Optional[Callable[[str], None]] = None) -> List[Dict]:
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = OutputManifest(output_dir)
+    pipeline = IconPipeline(appid, output_dir, concurrency, per_host)
+    writer = AchievementWriter(os.path.join(output_dir, "achievements.json"))
+    saved = []
+    hashes = {}
+    icons = {}
+
+    try:
+        for achievement in achievements:
+            writer.write(achievement)
+            hashes[achievement['name']] = hash_entry(achievement)
+            for icon in (achievement.get('icon'), achievement.get('icongray')):
+                icon_name = (icon or "").split('/')[-1]
+                if icon_name and not manifest.has_icon(icon_name):
+                    pipeline.submit(icon_name)
+                icons[icon_name] = True
+            saved.append(achievement)
+    except BaseException:
+        writer.abort()
+        pipeline.close(silent=True)
+        raise
+
+    icons.pop("", None)
+    written = writer.close(manifest.digest)
+    statuses = pipeline.close(silent)
+    failed = sorted(name for name, status in statuses.items() if status not in IMAGE_OK_STATUSES)
+    if failed and progress:
+        progress(f"Could not download {len(failed)} achievement icons: {', '.join(failed[:5])}{', ...' if len(failed) > 5 else ''}")
+    orphans = manifest.remove_orphans(icons)
 
-            image_url = f"https://cdn.fastly.steamstatic.com/steamcommunity/public/images/apps/{appid}/{image_file_name}"
-            image_path = os.path.join(image_folder, image_file_name)
-            
-            download_tasks.append((image_url, image_path, headers))
-            downloaded_images.add(image_file_name)
-    
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        list(executor.map(download_one_image, download_tasks))
-
-def fetch_from_steamdb(appid: str, silent: bool = False) -> List[Dict]:
-    session = create_session("steamdb", appid)
-    url = f"https://steamdb.info/api/RenderAppSection/?section=stats&appid={appid}"
     if not silent:
-        print("Fetching achievements from SteamDB...")
-    response = mk_request(url, session)
-    soup = BeautifulSoup(response.text, 'html.parser')
-    achievements = []
-    
-    achievement_divs = soup.select('div.achievement')
-    
-    for achievement_div in achievement_divs:
+        added, changed, removed = manifest.diff(hashes)
+        print(f"Achievements: {len(added)} new, {len(changed)} changed, {len(removed)} removed, {len(orphans)} icons removed" + ("" if written else " (achievements.json unchanged)"))
+
+    # Failed icons stay out of the manifest so the next run retries them
+    icon_entries = {name: manifest.icon_entry(name) for name in icons if statuses.get(name, "ok") in IMAGE_OK_STATUSES}
+    manifest.save(source, writer.digest, hashes, icon_entries)
+    return saved
+
+def iter_steamdb_achievements(markup, backend: Optional[str] = None) -> Iterator[Dict]:
+    soup = parse_html(markup, section=("div", {"class": "achievement"}), backend=backend)
+    for achievement_div in soup.select('div.achievement'):
         name_div = achievement_div.select_one('div.achievement_api')
         if not name_div:
             continue
-        name = name_div.text.strip()
+        name = name_div.text().strip()
 
         display_name_div = achievement_div.select_one('div.achievement_name')
-        display_name = display_name_div.text.strip() if display_name_div else ""
+        display_name = display_name_div.text().strip() if display_name_div else ""
         desc_div = achievement_div.select_one('div.achievement_desc')
         hidden = 0
         description = ""
@@ -105,72 +206,246 @@ def fetch_from_steamdb(appid: str, silent: bool = False) -> List[Dict]:
             hidden_span = desc_div.select_one('span.achievement_spoiler')
             if hidden_span:
                 hidden = 1
-                description = hidden_span.text.strip()
+                description = hidden_span.text().strip()
             else:
-                description = desc_div.text.strip()
+                description = desc_div.text().strip()
         
         icon_imgs = achievement_div.select('img')
         icon = ""
         icongray = ""
         if len(icon_imgs) >= 1:
-            icon = icon_imgs[0].get('data-name', '')
+            icon = icon_imgs[0].attr('data-name')
         if len(icon_imgs) >= 2:
-            icongray = icon_imgs[1].get('data-name', '')
+            icongray = icon_imgs[1].attr('data-name')
         
-        achievements.append({
+        yield {
             "description": description,
             "displayName": display_name,
             "hidden": hidden,
             "icon": f"images/{icon}",
             "icongray": f"images/{icongray}",
             "name": name
-        })
-
-    with open("achievements.json", "w", encoding='utf-8') as json_file:
-        json.dump(achievements, json_file, indent=2, ensure_ascii=False)
-    
-    steam_session = create_session("steam")
-    download_images(appid, achievements, steam_session, silent)
-    steam_session.close()
-    session.close()
-    return achievements
-
-def fetch_from_steamcommunity(appid: str, silent: bool = False):
-    session = create_session("steam")
-    url = f"https://steamcommunity.com/stats/{appid}/achievements/"
-    if not silent:
-        print("Fetching achievements from Steam Community...")
-    response = mk_request(url, session)
-    soup = BeautifulSoup(response.content, 'html.parser')
+        }
 
-    achievements = []
-    achievement_rows = soup.select('.achieveRow')
-    if not silent:
-        print(f"Found {len(achievement_rows)} achievements...")
+# GetSchemaForGame JSON, icons come as full CDN URLs
+def iter_schema_achievements(schema: Dict) -> Iterator[Dict]:
+    stats = schema.get('game', {}).get('availableGameStats', {})
+    for achievement in stats.get('achievements', []):
+        yield {
+            "description": achievement.get('description', ""),
+            "displayName": achievement.get('displayName', ""),
+            "hidden": int(achievement.get('hidden', 0)),
+            "icon": f"images/{achievement.get('icon', '').split('/')[-1]}",
+            "icongray": f"images/{achievement.get('icongray', '').split('/')[-1]}",
+            "name": achievement['name']
+        }
 
-    for idx, achievement in enumerate(achievement_rows):
-        icon_src = achievement.select_one('.achieveImgHolder img')['src']
+def iter_steamcommunity_achievements(markup, backend: Optional[str] = None) -> Iterator[Dict]:
+    soup = parse_html(markup, section=("div", {"class": "achieveRow"}), backend=backend)
+    for idx, achievement in enumerate(soup.select('.achieveRow')):
+        icon_img = achievement.select_one('.achieveImgHolder img')
+        icon_src = icon_img.attr('src') if icon_img else ""
         icon = icon_src.split('/')[-1]
         
-        displayName = achievement.select_one('.achieveTxt h3').text.strip()
+        display_name_tag = achievement.select_one('.achieveTxt h3')
+        displayName = display_name_tag.text().strip() if display_name_tag else ""
         description_tag = achievement.select_one('.achieveTxt h5')
-        description = description_tag.text.strip() if description_tag else ""
+        description = description_tag.text().strip() if description_tag else ""
         hidden = 1 if description == "" else 0
 
-        achievements.append({
+        yield {
             "description": description,
             "displayName": displayName,
             "hidden": hidden,
             "icon": f"images/{icon}",
             "icongray": f"images/{icon}",
             "name": f"ach{idx + 1}"
-        })
+        }
+
+# Loaders fetch the page right away and parse it lazily, so a winning source can be
+# written while the rest of its page is still being parsed.
+# GetSchemaForGame has no keyless variant, without steam_api_key the schema source is left out.
+def load_from_schema(appid: str, api_key: Optional[str] = None, language: str = DEFAULT_LANGUAGE) -> Iterator[Dict]:
+    if not api_key:
+        raise RuntimeError("Steam Web API key required for the stats schema")
+    url = f"{STEAM_API_URL}/ISteamUserStats/GetSchemaForGame/v2/"
+    response = http_get(url, params={"key": api_key, "appid": appid, "l": language}, timeout=30)
+    response.raise_for_status()
+    return iter_schema_achievements(response.json())
+
+# SteamDB only lists English texts
+def load_from_steamdb(appid: str, api_key: Optional[str] = None, language: str = DEFAULT_LANGUAGE) -> Iterator[Dict]:
+    url = f"https://steamdb.info/api/RenderAppSection/?section=stats&appid={appid}"
+    with pooled_session("steamdb") as session:
+        response = mk_request(url, session, headers={"referer": f"https://steamdb.info/app/{appid}/stats/"})
+    return iter_steamdb_achievements(response.text)
+
+def load_from_steamcommunity(appid: str, api_key: Optional[str] = None, language: str = DEFAULT_LANGUAGE) -> Iterator[Dict]:
+    url = f"https://steamcommunity.com/stats/{appid}/achievements/?l={language}"
+    with pooled_session("steam") as session:
+        response = mk_request(url, session)
+    return iter_steamcommunity_achievements(response.content)
+
+# Parse-only loaders, nothing is written until a source wins
+ACHIEVEMENT_SOURCES = {
+    "schema": load_from_schema,
+    "steamdb": load_from_steamdb,
+    "steamcommunity": load_from_steamcommunity
+}
+
+# The official schema keeps real API names and gray icons, so it goes first whenever a key is set
+def default_sources(use_steam: bool = False, api_key: Optional[str] = None) -> tuple:
+    sources = ("steamcommunity",) if use_steam else ("steamdb", "steamcommunity")
+    return ("schema",) + sources if api_key else sources
+
+# Steam Community has no API names (they are made up as ach1, ach2...) and no gray icons,
+# so its result only counts once every other source failed
+GUESSED_NAME_SOURCES = {"steamcommunity"}
+
+# Runs a loader up to its first achievement, which stands for the whole page. Returns the
+# complete stream again, or None when the page has no usable achievements.
+def open_source(source: str, appid: str, api_key: Optional[str] = None) -> Optional[Iterator[Dict]]:
+    achievements = ACHIEVEMENT_SOURCES[source](appid, api_key)
+    first = next(achievements, None)
+    if not (first and first.get('name')):
+        return None
+    return itertools.chain([first], achievements)
+
+def load_list(source: str, appid: str, api_key: Optional[str] = None, language: str = DEFAULT_LANGUAGE) -> List[Dict]:
+    return list(ACHIEVEMENT_SOURCES[source](appid, api_key, language))
+
+# Start the first source, hedge with the next one after hedge_delay (or right away if it fails),
+# and keep the first valid result from a source with real API names. A guessed-name result is
+# held back while any such source is still running or queued. Returns (source, achievement stream)
+# or (None, None), the winner's page is only parsed past its first achievement by the caller.
+def fetch_hedged(appid: str, sources=("steamdb", "steamcommunity"), hedge_delay: float = HEDGE_DELAY, api_key: Optional[str] = None):
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(sources))
+    pending = {}
+    queued = list(sources)
+    fallback = (None, None)
+
+    def start_next():
+        source = queued.pop(0)
+        pending[executor.submit(open_source, source, appid, api_key)] = source
+
+    try:
+        start_next()
+        while pending:
+            timeout = hedge_delay if queued else None
+            done, _ = concurrent.futures.wait(pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+            if not done:
+                start_next()    # Hedge: first source is slow
+                continue
+
+            for future in done:
+                source = pending.pop(future)
+                try:
+                    achievements = future.result()
+                except Exception:
+                    achievements = None
+                if achievements is None:
+                    continue
+                if source not in GUESSED_NAME_SOURCES:
+                    return source, achievements
+                if fallback[0] is None:
+                    fallback = (source, achievements)
+
+            if queued and not pending:
+                start_next()
+        return fallback
+    finally:
+        # Losers are abandoned, their results are never written
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def english_text(text) -> str:
+    return text.get(DEFAULT_LANGUAGE, "") if isinstance(text, dict) else text
+
+# Finds the localized entry of an achievement. Entries are matched by API name while both lists
+# name them the same way. Otherwise reference is the localized source's own English list, in the
+# same order as the localized one: the achievement is found there by icon, or by icon and English
+# name when several achievements share an icon (tiered ones usually do), and its name there picks
+# the localized entry. Achievements that are still ambiguous get no translation.
+def localized_matcher(localized: List[Dict], reference: Optional[List[Dict]] = None) -> Callable[[Dict], Optional[Dict]]:
+    by_name = {achievement['name']: achievement for achievement in localized}
+    if reference is None:
+        return lambda achievement: by_name.get(achievement['name'])
 
-    with open('achievements.json', 'w', encoding='utf-8') as json_file:
-        json.dump(achievements, json_file, indent=2, ensure_ascii=False)
-    
-    download_images(appid, achievements, session, silent)
-    session.close()
+    by_icon = defaultdict(list)
+    for entry in reference:
+        by_icon[entry['icon']].append(entry)
+
+    def match(achievement: Dict) -> Optional[Dict]:
+        candidates = by_icon.get(achievement['icon'], [])
+        if len(candidates) > 1:
+            display_name = english_text(achievement['displayName'])
+            candidates = [entry for entry in candidates if entry['displayName'] == display_name]
+        return by_name.get(candidates[0]['name']) if len(candidates) == 1 else None
+    return match
+
+# Goldberg reads displayName/description either as plain text or as a {language: text} dict
+def merge_language(achievement: Dict, language: str, entry: Dict):
+    for field in ("displayName", "description"):
+        if not entry[field]:
+            continue
+        if not isinstance(achievement[field], dict):
+            achievement[field] = {DEFAULT_LANGUAGE: achievement[field]}
+        achievement[field][language] = entry[field]
+
+def localize(achievements: Iterable[Dict], matchers: Dict[str, Callable[[Dict], Optional[Dict]]]) -> Iterator[Dict]:
+    for achievement in achievements:
+        for language, match in matchers.items():
+            if entry := match(achievement):
+                merge_language(achievement, language, entry)
+        yield achievement
+
+# The English list is hedged as usual while every other language is fetched alongside it,
+# icons are shared between languages so they are only downloaded once. When a source that names
+# achievements differently may win, the localized source's English list is fetched too for matching.
+# The winner streams into save_achievements, so icons download while its page is still being parsed.
+def fetch_achievements(appid: str, output_dir: str = ".", sources=None, hedge_delay: float = HEDGE_DELAY, silent: bool = False, api_key: Optional[str] = None, languages=(DEFAULT_LANGUAGE,), concurrency: int = IMAGE_CONCURRENCY, per_host: int = IMAGE_HOST_CONNECTIONS, progress: Optional[Callable[[str], None]] = None) -> List[Dict]:
+    languages = [language for language in dict.fromkeys(languages) if language != DEFAULT_LANGUAGE]
+    sources = sources or default_sources(api_key=api_key)
+    localized_source = LOCALIZED_SOURCES[0] if api_key else LOCALIZED_SOURCES[1]
+    guessed_names = localized_source in GUESSED_NAME_SOURCES
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(languages) + 1)
+    matchers = {}
+
+    try:
+        localized = {language: executor.submit(load_list, localized_source, appid, api_key, language) for language in languages}
+        mixed_names = languages and any((source in GUESSED_NAME_SOURCES) != guessed_names for source in sources)
+        reference = executor.submit(load_list, localized_source, appid, api_key) if mixed_names else None
+        source, achievements = fetch_hedged(appid, sources, hedge_delay, api_key)
+        if not achievements:
+            return []
+        if not silent:
+            print(f"Fetching achievements from {source}...")
+
+        for language, future in localized.items():
+            try:
+                same_names = (source in GUESSED_NAME_SOURCES) == guessed_names
+                matchers[language] = localized_matcher(future.result(), None if same_names else reference.result())
+            except Exception as e:
+                if not silent:
+                    print(f"Failed to fetch {language} achievements: {e}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    saved = save_achievements(appid, localize(achievements, matchers), output_dir, silent, source, concurrency, per_host, progress)
+    if not silent:
+        print(f"Found {len(saved)} achievements...")
+    return saved
+
+def fetch_from_steamdb(appid: str, silent: bool = False, output_dir: str = ".", concurrency: int = IMAGE_CONCURRENCY, per_host: int = IMAGE_HOST_CONNECTIONS) -> List[Dict]:
+    if not silent:
+        print("Fetching achievements from SteamDB...")
+    return save_achievements(appid, load_from_steamdb(appid), output_dir, silent, "steamdb", concurrency, per_host)
+
+def fetch_from_steamcommunity(appid: str, silent: bool = False, output_dir: str = ".", concurrency: int = IMAGE_CONCURRENCY, per_host: int = IMAGE_HOST_CONNECTIONS):
+    if not silent:
+        print("Fetching achievements from Steam Community...")
+    achievements = save_achievements(appid, load_from_steamcommunity(appid), output_dir, silent, "steamcommunity", concurrency, per_host)
+    if not silent:
+        print(f"Found {len(achievements)} achievements...")
     return achievements
 
 # def main():
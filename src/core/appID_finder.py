@@ -1,83 +1,633 @@
 import os
+import re
+import json
+import time
+import codecs
 import sqlite3
-from curl_cffi import requests
-
-def get_steam_data(output_dir='assets'):
-    os.makedirs(output_dir, exist_ok=True)
-    db_file = os.path.join(output_dir, 'steam_data.db')
-    
-    conn = sqlite3.connect(db_file)
-    cursor = conn.cursor()
-    cursor.execute('''CREATE TABLE IF NOT EXISTS apps (appid INTEGER PRIMARY KEY, name TEXT)''')
-    
-    cursor.execute('SELECT COUNT(*) FROM apps')
-    if cursor.fetchone()[0] == 0:
-        api = "https://api.steampowered.com/ISteamApps/GetAppList/v0002/"
-        response = requests.get(api, timeout=30)
-        app_list = response.json()['applist']['apps']
-        
-        cursor.execute('BEGIN TRANSACTION')
-        for app in app_list:
-            cursor.execute('''INSERT OR IGNORE INTO apps (appid, name) VALUES (?, ?)''', (app['appid'], app['name']))
-        conn.commit()
-    
-    return conn
+import threading
+import unicodedata
+import concurrent.futures
+from itertools import islice
+from collections import OrderedDict
+from .httpClient import STEAM_API_URL, http_get, pooled_session
+from .appSnapshot import SNAPSHOT_FILE, read_snapshot, write_snapshot
 
-def get_steam_app_by_name(app_name):
-    conn = get_steam_data()
-    try:
-        cursor = conn.cursor()
-        cursor.execute('''SELECT appid, name FROM apps WHERE LOWER(name) = LOWER(?)''', (app_name,))
-        result = cursor.fetchone()
-        
-        if result:
-            return {'appid': result[0], 'name': result[1]}
-        
-        # If no match, searching
+DB_FILE = os.path.join("assets", "steam_data.db")
+
+APP_LIST_URL = f"{STEAM_API_URL}/ISteamApps/GetAppList/v0002/"
+STORE_APP_LIST_URL = f"{STEAM_API_URL}/IStoreService/GetAppList/v1/"
+STORE_PAGE_SIZE = 50000
+# App type stored in the index -> IStoreService/GetAppList filter that lists it
+STORE_APP_TYPES = {"game": "include_games", "dlc": "include_dlc", "application": "include_software"}
+REFRESH_INTERVAL = 24 * 60 * 60
+# Without a key a refresh downloads the whole list, unknown apps are resolved online meanwhile
+FULL_REFRESH_INTERVAL = 30 * 24 * 60 * 60
+
+# How long failed network lookups are remembered
+NOT_FOUND_TTL = 7 * 24 * 60 * 60
+ERROR_TTL = 10 * 60
+
+# Suffix words that are dropped when a full-token match finds nothing
+EDITION_WORDS = {"edition", "goty", "game", "of", "the", "year", "deluxe", "definitive", "complete", "ultimate", "remastered", "enhanced", "special", "gold", "collectors", "digital", "anniversary", "directors", "cut"}
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# Per-character folding table, filled lazily as new characters are seen
+class CharFolding(dict):
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char == '\u2019':
+            value = ''
+        elif unicodedata.category(char).startswith('S'):
+            value = ' '    # Symbols such as \u2122/\u00ae are dropped before NFKD would expand them into letters
+        else:
+            value = "".join(c for c in unicodedata.normalize('NFKD', char) if not unicodedata.combining(c))
+        self[codepoint] = value
+        return value
+
+CHAR_FOLDING = CharFolding()
+
+def normalize_name(name):
+    if not name.isascii():
+        name = name.translate(CHAR_FOLDING)
+    return " ".join(TOKEN_PATTERN.findall(name.replace("'", "").lower()))
+
+INGEST_BATCH_SIZE = 5000
+FTS_SCHEMA = 'fts5(norm, tokenize="unicode61 remove_diacritics 2")'
+
+# Incrementally parse the {"applist": {"apps": [...]}} payload. The complete objects of each
+# chunk (everything up to its last "},") are decoded in one json.loads call, the rest one object
+# at a time. A "}," inside a name makes the bulk decode fail, those chunks only use the slow path.
+def iter_app_list(chunks):
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buffer = ""
+    in_array = False
+
+    for chunk in chunks:
+        buffer += utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        pos = 0
+
+        if not in_array:
+            start = buffer.find('"apps"')
+            bracket = buffer.find('[', start) if start != -1 else -1
+            if bracket == -1:
+                buffer = buffer[start:] if start != -1 else buffer[-8:]
+                continue
+            pos = bracket + 1
+            in_array = True
+
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if (end := buffer.rfind('},')) > pos:
+            try:
+                apps = json.loads(f"[{buffer[pos:end + 1]}]")
+            except json.JSONDecodeError:
+                pass
+            else:
+                for app in apps:
+                    yield app['appid'], app['name']
+                pos = end + 2
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                return
+            try:
+                app, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break    # Object continues in the next chunk
+            yield app['appid'], app['name']
+
+        buffer = buffer[pos:]
+
+# Long-lived app index, one shared connection for every lookup
+class AppIndex:
+    def __init__(self, db_file=DB_FILE, memo_size=1024, not_found_ttl=NOT_FOUND_TTL, error_ttl=ERROR_TTL, snapshot_file=SNAPSHOT_FILE):
+        os.makedirs(os.path.dirname(db_file) or ".", exist_ok=True)
+        self.db_file = db_file
+        self.snapshot_file = snapshot_file
+        self.memo_size = memo_size
+        self.miss_ttls = {'not_found': not_found_ttl, 'error': error_ttl}
+        self._memo = OrderedDict()
+        self._lock = threading.RLock()
+        self._populated = False
+        self._search_ready = False
+        self._search_thread = None
+        self._search_dirty = None    # Apps renamed while the search index is being built
+        self._refresh_thread = None
+
+        # Connection is shared between worker threads, access is serialized by _lock
+        self.conn = sqlite3.connect(db_file, check_same_thread=False, cached_statements=256)
+        self.conn.create_function('normalize_name', 1, normalize_name, deterministic=True)
+        self._configure()
+
+    def _configure(self):
+        cursor = self.conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-16000')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS apps (appid INTEGER PRIMARY KEY, name TEXT, type TEXT, parent INTEGER)''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS misses (kind TEXT, key TEXT, reason TEXT, expires REAL, PRIMARY KEY (kind, key))''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS dlc_cache (appid INTEGER PRIMARY KEY, dlcs TEXT, sources TEXT, fetched REAL)''')
+        cursor.execute('''CREATE INDEX IF NOT EXISTS apps_name_nocase ON apps (name COLLATE NOCASE)''')
+
+        # Databases created before app types and DLC parents were tracked
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(apps)')}
+        if 'type' not in columns:
+            cursor.execute('ALTER TABLE apps ADD COLUMN type TEXT')
+        if 'parent' not in columns:
+            cursor.execute('ALTER TABLE apps ADD COLUMN parent INTEGER')
+        cursor.execute('''CREATE INDEX IF NOT EXISTS apps_parent ON apps (parent)''')
+
+        # Full-text index over normalized names (rowid = appid), skipped when SQLite is built without FTS5
         try:
-            search_url = f"https://steamcommunity.com/actions/SearchApps/{app_name}"
-            response = requests.get(search_url, timeout=30)
-            search_results = response.json()
-            
-            for result in search_results:
-                if result['name'].lower() == app_name.lower():
-                    cursor.execute('''INSERT OR IGNORE INTO apps (appid, name) VALUES (?, ?)''', (result['appid'], result['name']))
-                    conn.commit()
-                    return {'appid': result['appid'], 'name': result['name']}
-                
-        except Exception as e:
-            print(f"Search error: {e}")
+            cursor.execute(f'''CREATE VIRTUAL TABLE IF NOT EXISTS apps_fts USING {FTS_SCHEMA}''')
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False
+        self.conn.commit()
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            result = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return result[0] if result else default
+
+    def set_meta(self, key, value):
+        with self._lock:
+            with self.conn:
+                self.conn.execute('''INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)''', (key, str(value)))
+
+    # Normalizing every name costs more than the bulk load itself, so the index is built into
+    # apps_fts_build on a connection of its own and swapped in under _lock at the end. Apps
+    # renamed meanwhile are collected by upsert/add_app and re-indexed after the swap.
+    # The NOCASE name index dropped by ingest is recreated on the same connection first.
+    def rebuild_search_index(self, batch_size=INGEST_BATCH_SIZE):
+        with self._lock:
+            self._search_dirty = set()
+
+        try:
+            self._build_search_table(batch_size)
+            with self._lock:
+                with self.conn:
+                    if self.has_fts:
+                        self.conn.execute('DROP TABLE apps_fts')
+                        self.conn.execute('ALTER TABLE apps_fts_build RENAME TO apps_fts')
+                        dirty = json.dumps(sorted(self._search_dirty))
+                        self.conn.execute('''DELETE FROM apps_fts WHERE rowid IN (SELECT value FROM json_each(?))''', (dirty,))
+                        self.conn.execute('''INSERT INTO apps_fts (rowid, norm) SELECT appid, normalize_name(name) FROM apps WHERE appid IN (SELECT value FROM json_each(?))''', (dirty,))
+                    self.conn.execute('''INSERT OR REPLACE INTO meta (key, value) VALUES ('fts_built', '1')''')
+                self._search_ready = True
+        finally:
+            with self._lock:
+                self._search_dirty = None
+
+    def _build_search_table(self, batch_size):
+        builder = sqlite3.connect(self.db_file, timeout=30)
+        try:
+            with builder:
+                builder.execute('''CREATE INDEX IF NOT EXISTS apps_name_nocase ON apps (name COLLATE NOCASE)''')
+            if not self.has_fts:
+                return
+            with builder:
+                builder.execute('DROP TABLE IF EXISTS apps_fts_build')
+                builder.execute(f'''CREATE VIRTUAL TABLE apps_fts_build USING {FTS_SCHEMA}''')
+            last_appid = -1
+            while batch := builder.execute('''SELECT appid, name FROM apps WHERE appid > ? ORDER BY appid LIMIT ?''', (last_appid, batch_size)).fetchall():
+                with builder:
+                    builder.executemany('''INSERT INTO apps_fts_build (rowid, norm) VALUES (?, ?)''', ((appid, normalize_name(name or "")) for appid, name in batch))
+                last_appid = batch[-1][0]
+        finally:
+            builder.close()
+
+    # The indexes are built in the background once the table is usable. Exact lookups scan
+    # the table until then, only fuzzy name searches wait for the build.
+    def _start_search_index(self):
+        with self._lock:
+            if self._search_ready or (self._search_thread and self._search_thread.is_alive()):
+                return self._search_thread
+            if self.get_meta('fts_built') is not None:
+                self._search_ready = True
+                return None
+
+            def run():
+                try:
+                    self.rebuild_search_index()
+                except Exception as e:
+                    print(f"Search index error: {e}")
+
+            self._search_thread = threading.Thread(target=run, daemon=True)
+            self._search_thread.start()
+            return self._search_thread
+
+    def ensure_search_index(self):
+        if self._search_ready:
+            return
+        if thread := self._start_search_index():
+            thread.join()
+
+    # Negative cache for network fallbacks, reason is 'not_found' or 'error'
+    def get_miss(self, kind, key):
+        with self._lock:
+            result = self.conn.execute('SELECT reason, expires FROM misses WHERE kind = ? AND key = ?', (kind, str(key))).fetchone()
+        if result and result[1] > time.time():
+            return result[0]
         return None
-    
-    finally:
-        conn.close()
 
-def get_steam_app_by_id(appid):
-    conn = get_steam_data()
-    try:
-        cursor = conn.cursor()
-        cursor.execute('SELECT name FROM apps WHERE appid = ?', (int(appid),))
-        result = cursor.fetchone()
-        
-        if result:
-            return {'appid': int(appid), 'name': result[0]}
-        
-        # If not found, try Steam store
+    def record_miss(self, kind, key, reason):
+        expires = time.time() + self.miss_ttls[reason]
+        with self._lock:
+            with self.conn:
+                self.conn.execute('DELETE FROM misses WHERE expires < ?', (time.time(),))
+                self.conn.execute('''INSERT OR REPLACE INTO misses (kind, key, reason, expires) VALUES (?, ?, ?, ?)''', (kind, str(key), reason, expires))
+
+    def _memo_get(self, key):
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+        return None
+
+    def _memo_put(self, key, value):
+        with self._lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def ensure_populated(self):
+        if self._populated:
+            return
+
+        with self._lock:
+            if self._populated:
+                return
+
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT 1 FROM apps LIMIT 1')
+            if cursor.fetchone() is None:
+                if not self.load_snapshot(self.snapshot_file):
+                    with pooled_session() as session:
+                        response = session.get(APP_LIST_URL, timeout=30, stream=True)
+                        try:
+                            response.raise_for_status()
+                            self.ingest(iter_app_list(response.iter_content(chunk_size=65536)))
+                        finally:
+                            response.close()
+                    self.set_meta('last_sync', int(time.time()))
+
+            self._populated = True
+        self._start_search_index()
+
+    # Bulk load (appid, name) pairs in batches, the name and search indexes are left to the
+    # background build
+    def ingest(self, apps, batch_size=INGEST_BATCH_SIZE):
+        apps = iter(apps)
+        with self._lock:
+            with self.conn:
+                self.conn.execute('DROP INDEX IF EXISTS apps_name_nocase')
+                while batch := list(islice(apps, batch_size)):
+                    self.conn.executemany('''INSERT OR IGNORE INTO apps (appid, name) VALUES (?, ?)''', batch)
+                self.conn.execute('''DELETE FROM meta WHERE key = 'fts_built' ''')
+            self._search_ready = False
+
+    # Seed an empty index from the bundled snapshot, later refreshes fetch only what changed since it was built
+    def load_snapshot(self, path=SNAPSHOT_FILE):
+        if not path or not os.path.exists(path):
+            return False
         try:
-            store_url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
-            response = requests.get(store_url, timeout=30)
-            store_data = response.json()
-            
-            if str(appid) in store_data and store_data[str(appid)]['success']:
-                app_details = store_data[str(appid)]['data']
-                name = app_details.get('name', 'Unknown')
-                cursor.execute('''INSERT OR IGNORE INTO apps (appid, name) VALUES (?, ?)''', (int(appid), name))
-                conn.commit()
-                return {'appid': int(appid), 'name': name}
-            
+            created, apps = read_snapshot(path)
+            self.ingest(apps)
         except Exception as e:
-            print(f"Search error: {e}")
-        
+            print(f"Snapshot error: {e}")
+            return False
+        self.set_meta('last_sync', created)
+        self.set_meta('seeded', int(time.time()))
+        return True
+
+    def export_snapshot(self, path=SNAPSHOT_FILE):
+        self.ensure_populated()
+        with self._lock:
+            apps = self.conn.execute('SELECT appid, name FROM apps').fetchall()
+        return write_snapshot(apps, path, int(self.get_meta('last_sync', 0)) or None)
+
+    # Insert new apps and rename changed ones, keeping the search index in step.
+    # Items are (appid, name) or (appid, name, type), a missing type keeps the stored one.
+    def upsert(self, apps, batch_size=INGEST_BATCH_SIZE):
+        apps = iter(apps)
+        count = 0
+        while batch := list(islice(apps, batch_size)):
+            with self._lock:
+                # Only new, renamed or retyped apps are written
+                batch = {app[0]: (app[1], app[2] if len(app) > 2 else None) for app in batch}
+                known = {appid: (name, app_type) for appid, name, app_type in self.conn.execute('''SELECT appid, name, type FROM apps WHERE appid IN (SELECT value FROM json_each(?))''', (json.dumps(list(batch)),))}
+                changed = [(appid, name, app_type) for appid, (name, app_type) in batch.items() if appid not in known or known[appid][0] != name or (app_type and known[appid][1] != app_type)]
+                renamed = [(appid, name) for appid, name, _ in changed if known.get(appid, (None,))[0] != name]
+                if not changed:
+                    continue
+
+                with self.conn:
+                    self.conn.executemany('''INSERT INTO apps (appid, name, type) VALUES (?, ?, ?) ON CONFLICT (appid) DO UPDATE SET name = excluded.name, type = COALESCE(excluded.type, apps.type)''', changed)
+                    if self.has_fts and renamed:
+                        self.conn.executemany('DELETE FROM apps_fts WHERE rowid = ?', ((appid,) for appid, _ in renamed))
+                        self.conn.executemany('''INSERT INTO apps_fts (rowid, norm) VALUES (?, normalize_name(?))''', renamed)
+                        if self._search_dirty is not None:
+                            self._search_dirty.update(appid for appid, _ in renamed)
+                self._memo.clear()
+            count += len(changed)
+        return count
+
+    # Page through IStoreService/GetAppList for apps changed since the last sync, one app type at a time
+    def _iter_store_changes(self, api_key, since):
+        for app_type, include_param in STORE_APP_TYPES.items():
+            last_appid = 0
+            while True:
+                params = {"key": api_key, "if_modified_since": since, "last_appid": last_appid, "max_results": STORE_PAGE_SIZE}
+                params.update({param: "true" if param == include_param else "false" for param in STORE_APP_TYPES.values()})
+                response = http_get(STORE_APP_LIST_URL, params=params, timeout=30)
+                response.raise_for_status()
+                page = response.json().get('response', {})
+
+                for app in page.get('apps', []):
+                    yield app['appid'], app['name'], app_type
+
+                if not page.get('have_more_results') or 'last_appid' not in page:
+                    break
+                last_appid = page['last_appid']
+
+    # Keyed refreshes fetch only what changed since last_sync. The keyless full download runs
+    # after full_max_age, counted from the later of the last sync and seeding from the snapshot,
+    # so a fresh install doesn't download the list right after starting from the snapshot.
+    def refresh(self, api_key=None, max_age=REFRESH_INTERVAL, full_max_age=FULL_REFRESH_INTERVAL):
+        self.ensure_populated()
+        last_sync = int(self.get_meta('last_sync', 0))
+        started = int(time.time())
+        if api_key and started - last_sync < max_age:
+            return 0
+        if not api_key and started - max(last_sync, int(self.get_meta('seeded', 0))) < full_max_age:
+            return 0
+
+        if api_key:
+            # The snapshot and GetAppList carry no types, the first keyed refresh lists everything once
+            typed = self.get_meta('types_synced') is not None
+            count = self.upsert(self._iter_store_changes(api_key, last_sync if typed else 0))
+            self.set_meta('types_synced', started)
+        else:
+            # Without a Web API key only the full list is available
+            with pooled_session() as session:
+                response = session.get(APP_LIST_URL, timeout=30, stream=True)
+                try:
+                    response.raise_for_status()
+                    count = self.upsert(iter_app_list(response.iter_content(chunk_size=65536)))
+                finally:
+                    response.close()
+
+        self.set_meta('last_sync', started)
+        return count
+
+    def refresh_in_background(self, api_key=None, max_age=REFRESH_INTERVAL, full_max_age=FULL_REFRESH_INTERVAL):
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return self._refresh_thread
+
+            def run():
+                try:
+                    self.refresh(api_key, max_age, full_max_age)
+                except Exception as e:
+                    print(f"App list refresh error: {e}")
+
+            self._refresh_thread = threading.Thread(target=run, daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    # New apps are inserted, known ones only get a name when GetAppList listed them without one
+    def add_app(self, appid, name, app_type=None, parent=None):
+        with self._lock:
+            with self.conn:
+                cursor = self.conn.execute('''INSERT INTO apps (appid, name, type, parent) VALUES (?, ?, ?, ?) ON CONFLICT (appid) DO UPDATE SET name = excluded.name, type = COALESCE(excluded.type, apps.type), parent = COALESCE(excluded.parent, apps.parent) WHERE COALESCE(apps.name, '') = '' ''', (int(appid), name, app_type, parent))
+                if cursor.rowcount and self.has_fts:
+                    self.conn.execute('DELETE FROM apps_fts WHERE rowid = ?', (int(appid),))
+                    self.conn.execute('''INSERT INTO apps_fts (rowid, norm) VALUES (?, ?)''', (int(appid), normalize_name(name)))
+                    if self._search_dirty is not None:
+                        self._search_dirty.add(int(appid))
+        result = {'appid': int(appid), 'name': name}
+        self._memo_put(('id', int(appid)), result)
+        self._memo_put(('name', name.lower()), result)
+        return result
+
+    def lookup_id(self, appid):
+        if cached := self._memo_get(('id', int(appid))):
+            return cached
+
+        self.ensure_populated()
+        with self._lock:
+            result = self.conn.execute('SELECT name FROM apps WHERE appid = ?', (int(appid),)).fetchone()
+        if not result:
+            return None
+
+        found = {'appid': int(appid), 'name': result[0]}
+        self._memo_put(('id', int(appid)), found)
+        return found
+
+    def lookup_name(self, app_name):
+        if cached := self._memo_get(('name', app_name.lower())):
+            return cached
+
+        self.ensure_populated()
+        with self._lock:
+            result = self.conn.execute('''SELECT appid, name FROM apps WHERE name = ? COLLATE NOCASE LIMIT 1''', (app_name,)).fetchone()
+        if not result:
+            result = self.search_name(app_name)
+        if not result:
+            return None
+
+        found = {'appid': result[0], 'name': result[1]}
+        self._memo_put(('name', app_name.lower()), found)
+        return found
+
+    # Resolve many appids and names against the local table in one query each
+    def lookup_many(self, appids=(), app_names=()):
+        appids = {int(appid) for appid in appids}
+        app_names = set(app_names)
+        found_ids = {}
+        found_names = {}
+        self.ensure_populated()
+
+        with self._lock:
+            if appids:
+                rows = self.conn.execute('''SELECT appid, name FROM apps WHERE appid IN (SELECT value FROM json_each(?))''', (json.dumps(sorted(appids)),))
+                found_ids = {appid: {'appid': appid, 'name': name} for appid, name in rows}
+            if app_names:
+                rows = self.conn.execute('''SELECT appid, name FROM apps WHERE name COLLATE NOCASE IN (SELECT value FROM json_each(?))''', (json.dumps(sorted(app_names)),))
+                by_lower = {}
+                for appid, name in rows:
+                    by_lower.setdefault(name.lower(), {'appid': appid, 'name': name})
+                found_names = {app_name: by_lower[app_name.lower()] for app_name in app_names if app_name.lower() in by_lower}
+
+        for app_name in app_names - found_names.keys():
+            if result := self.search_name(app_name):
+                found_names[app_name] = {'appid': result[0], 'name': result[1]}
+
+        for appid, result in found_ids.items():
+            self._memo_put(('id', appid), result)
+        for app_name, result in found_names.items():
+            self._memo_put(('name', app_name.lower()), result)
+        return found_ids, found_names
+
+    # Record the DLC list of a game, as returned by its store appdetails
+    def set_parent(self, parent, dlc_ids):
+        with self._lock:
+            with self.conn:
+                self.conn.execute('''UPDATE apps SET parent = ?, type = 'dlc' WHERE appid IN (SELECT value FROM json_each(?))''', (int(parent), json.dumps([int(dlc_id) for dlc_id in dlc_ids])))
+
+    # {dlc id: name} in one query, for the given ids or else every DLC known to belong to parent.
+    # GetAppList has many rows without a name, those count as unknown.
+    def lookup_dlcs(self, parent, dlc_ids=None):
+        self.ensure_populated()
+        with self._lock:
+            if dlc_ids is None:
+                rows = self.conn.execute('''SELECT appid, name FROM apps WHERE parent = ? AND name != '' ORDER BY appid''', (int(parent),))
+            else:
+                rows = self.conn.execute('''SELECT appid, name FROM apps WHERE appid IN (SELECT value FROM json_each(?)) AND name != '' ''', (json.dumps([int(dlc_id) for dlc_id in dlc_ids]),))
+            return dict(rows.fetchall())
+
+    # Merged DLC list of a game with the last success time per source, (dlcs, sources, fetched) or None
+    def get_dlc_cache(self, appid):
+        with self._lock:
+            result = self.conn.execute('SELECT dlcs, sources, fetched FROM dlc_cache WHERE appid = ?', (int(appid),)).fetchone()
+        if not result:
+            return None
+        return dict(json.loads(result[0])), json.loads(result[1]), result[2]
+
+    def set_dlc_cache(self, appid, dlcs, sources, fetched=None):
+        with self._lock:
+            with self.conn:
+                self.conn.execute('''INSERT OR REPLACE INTO dlc_cache (appid, dlcs, sources, fetched) VALUES (?, ?, ?, ?)''', (int(appid), json.dumps(list(dlcs.items())), json.dumps(sources), time.time() if fetched is None else fetched))
+
+    # Sequel numbers have to match as whole tokens, "fallout 7" must not find "fallout 76"
+    def _fts_candidates(self, tokens, limit):
+        query = " ".join(f'"{token}"' for token in tokens)
+        if not tokens[-1].isdigit():
+            query += "*"
+        with self._lock:
+            return self.conn.execute('''SELECT apps.appid, apps.name FROM apps_fts JOIN apps ON apps.appid = apps_fts.rowid WHERE apps_fts MATCH ? ORDER BY bm25(apps_fts) LIMIT ?''', (query, limit)).fetchall()
+
+    # Near-miss search for punctuation, symbols and edition suffixes. A candidate only counts when
+    # its normalized name equals the query, with or without the edition words; partial titles and
+    # other sequels are left to the SearchApps fallback instead of being taken as the answer.
+    def search_name(self, app_name, limit=50):
+        if not self.has_fts:
+            return None
+
+        query_norm = normalize_name(app_name)
+        tokens = query_norm.split()
+        if not tokens:
+            return None
+
+        self.ensure_search_index()
+        core_tokens = [token for token in tokens if token not in EDITION_WORDS]
+        accepted = {query_norm, " ".join(core_tokens)}
+        for search_tokens in (tokens, core_tokens):
+            if not search_tokens or (search_tokens is core_tokens and core_tokens == tokens):
+                continue
+            matches = [candidate for candidate in self._fts_candidates(search_tokens, limit) if normalize_name(candidate[1]) in accepted]
+            if matches:
+                return min(matches, key=lambda candidate: (normalize_name(candidate[1]) != query_norm, candidate[0]))
         return None
-    finally:
-        conn.close()
\ No newline at end of file
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+_app_index = None
+_app_index_lock = threading.Lock()
+
+def get_app_index():
+    global _app_index
+    if _app_index is None:
+        with _app_index_lock:
+            if _app_index is None:
+                _app_index = AppIndex()
+    return _app_index
+
+def refresh_app_index(api_key=None, background=True):
+    index = get_app_index()
+    if background:
+        return index.refresh_in_background(api_key)
+    return index.refresh(api_key)
+
+def get_steam_app_by_name(app_name):
+    index = get_app_index()
+    if result := index.lookup_name(app_name):
+        return result
+
+    miss_key = normalize_name(app_name)
+    if index.get_miss('name', miss_key):
+        return None
+
+    # If no match, searching
+    try:
+        search_url = f"https://steamcommunity.com/actions/SearchApps/{app_name}"
+        response = http_get(search_url, timeout=30)
+        search_results = response.json()
+
+        for result in search_results:
+            if normalize_name(result['name']) == miss_key:
+                return index.add_app(result['appid'], result['name'])
+        index.record_miss('name', miss_key, 'not_found')
+
+    except Exception as e:
+        print(f"Search error: {e}")
+        index.record_miss('name', miss_key, 'error')
+    return None
+
+def get_steam_app_by_id(appid):
+    index = get_app_index()
+    if result := index.lookup_id(appid):
+        return result
+
+    if index.get_miss('id', int(appid)):
+        return None
+
+    # If not found, try Steam store
+    try:
+        store_url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
+        response = http_get(store_url, timeout=30)
+        store_data = response.json()
+
+        if str(appid) in store_data and store_data[str(appid)]['success']:
+            app_details = store_data[str(appid)]['data']
+            return index.add_app(appid, app_details.get('name', 'Unknown'))
+        index.record_miss('id', int(appid), 'not_found')
+
+    except Exception as e:
+        print(f"Search error: {e}")
+        index.record_miss('id', int(appid), 'error')
+
+    return None
+
+# Resolve a mixed list of appids and names, results come back in input order
+def resolve_apps(queries, max_workers=8):
+    is_id = [isinstance(query, int) or str(query).strip().isdigit() for query in queries]
+    appids = [int(query) for query, by_id in zip(queries, is_id) if by_id]
+    app_names = [str(query).strip() for query, by_id in zip(queries, is_id) if not by_id]
+
+    found_ids, found_names = get_app_index().lookup_many(appids, app_names)
+
+    # Anything the local index can't answer goes through the network fallbacks
+    missing_ids = sorted(set(appids) - found_ids.keys())
+    missing_names = sorted(set(app_names) - found_names.keys())
+    if missing_ids or missing_names:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            id_futures = {appid: executor.submit(get_steam_app_by_id, appid) for appid in missing_ids}
+            name_futures = {app_name: executor.submit(get_steam_app_by_name, app_name) for app_name in missing_names}
+            found_ids.update((appid, future.result()) for appid, future in id_futures.items())
+            found_names.update((app_name, future.result()) for app_name, future in name_futures.items())
+
+    return [found_ids.get(int(query)) if by_id else found_names.get(str(query).strip()) for query, by_id in zip(queries, is_id)]
@@ -0,0 +1,48 @@
+import os
+import sys
+import mmap
+import time
+import zlib
+import struct
+from array import array
+from itertools import accumulate
+
+SNAPSHOT_FILE = os.path.join("assets", "steam_apps.snapshot")
+
+# Layout: magic, app count, creation time, then one zlib stream holding
+# the delta-encoded appids (uint32 LE) followed by NUL-separated UTF-8 names
+SNAPSHOT_MAGIC = b"GSEAPPS1"
+SNAPSHOT_HEADER = struct.Struct("<8sII")
+
+def write_snapshot(apps, path=SNAPSHOT_FILE, created=None):
+    apps = sorted((int(appid), name.replace("\0", " ")) for appid, name in apps)
+
+    appids = [appid for appid, _ in apps]
+    deltas = array('I', (appid - previous for appid, previous in zip(appids, [0] + appids)))
+    if sys.byteorder == 'big':
+        deltas.byteswap()
+    names = "\0".join(name for _, name in apps).encode('utf-8')
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(apps), int(created or time.time())))
+        f.write(zlib.compress(deltas.tobytes() + names, 9))
+    os.replace(tmp_path, path)
+    return len(apps)
+
+def read_snapshot(path=SNAPSHOT_FILE):
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        magic, count, created = SNAPSHOT_HEADER.unpack_from(mm)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not an app index snapshot: {path}")
+        body = zlib.decompress(mm[SNAPSHOT_HEADER.size:])
+
+    deltas = array('I')
+    deltas.frombytes(body[:count * 4])
+    if sys.byteorder == 'big':
+        deltas.byteswap()
+    names = body[count * 4:].decode('utf-8').split("\0") if count else []
+
+    if len(names) != count:
+        raise ValueError(f"Corrupt app index snapshot: {path}")
+    return created, zip(accumulate(deltas), names)
@@ -1,117 +1,268 @@
 import os
+import time
+import threading
 import concurrent.futures
-from bs4 import BeautifulSoup
-from curl_cffi import requests
-
-def create_session():
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.5 Safari/605.1.15",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br"
-    }
-    
-    session = requests.Session(
-        impersonate="safari15_5", 
-        headers=headers, 
-        timeout=10
-    )
+from .httpClient import http_get
+from .htmlParser import parse_html
+from .appID_finder import get_app_index
 
-    try:
-        session.cipher = ("TLS_AES_128_GCM_SHA256:TLS_AES_256_GCM_SHA384:TLS_CHACHA20_POLY1305_SHA256:TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384:TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256:TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384:TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256:TLS_RSA_WITH_AES_256_GCM_SHA384:TLS_RSA_WITH_AES_128_GCM_SHA256:TLS_RSA_WITH_AES_256_CBC_SHA:TLS_RSA_WITH_AES_128_CBC_SHA:TLS_ECDHE_ECDSA_WITH_3DES_EDE_CBC_SHA:TLS_ECDHE_RSA_WITH_3DES_EDE_CBC_SHA:TLS_RSA_WITH_3DES_EDE_CBC_SHA")
-        session.curve = "X25519:P-256:P-384:P-521"
-        session.sign_algo = ("ecdsa_secp256r1_sha256,rsa_pss_rsae_sha256,rsa_pkcs1_sha256,ecdsa_secp384r1_sha384,ecdsa_sha1,rsa_pss_rsae_sha384,rsa_pss_rsae_sha384,rsa_pkcs1_sha384,rsa_pss_rsae_sha512,rsa_pkcs1_sha512,rsa_pkcs1_sha1")
-        return session
-    except Exception:
-        return None
+DLC_CACHE_TTL = 24 * 60 * 60
+
+# Store requests for DLC names, concurrency adapts between these bounds
+DLC_MIN_WORKERS = 1
+DLC_MAX_WORKERS = 32
+DLC_INITIAL_WORKERS = 4
+DLC_TARGET_LATENCY = 1.5
+DLC_RETRIES = 1
+PROGRESS_INTERVAL = 1.0
+
+# Additive-increase/multiplicative-decrease limit on in-flight requests: +1 per window of
+# fast answers, halved on errors, shrunk a little when answers slow down
+class AdaptiveLimit:
+    def __init__(self, initial=DLC_INITIAL_WORKERS, minimum=DLC_MIN_WORKERS, maximum=DLC_MAX_WORKERS, target_latency=DLC_TARGET_LATENCY):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency, ok):
+        with self._cond:
+            self.in_flight -= 1
+            if not ok:
+                self.limit = max(self.minimum, self.limit / 2)
+            elif latency <= self.target_latency:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            else:
+                self.limit = max(self.minimum, self.limit * 0.9)
+            self._cond.notify_all()
 
-def fetch_steam_dlcs(session, app_id):
+# Rate-limited "DLC names: done/total" messages for the progress callback
+class Progress:
+    def __init__(self, callback, total, label="DLC names"):
+        self.callback = callback
+        self.total = total
+        self.label = label
+        self.done = 0
+        self.last_report = 0
+        self._lock = threading.Lock()
+
+    def advance(self):
+        with self._lock:
+            self.done += 1
+            now = time.monotonic()
+            if self.callback and (self.done == self.total or now - self.last_report >= PROGRESS_INTERVAL):
+                self.last_report = now
+                self.callback(f"{self.label}: {self.done}/{self.total}")
+
+def fetch_dlc_ids(app_id):
     url = f"https://store.steampowered.com/api/appdetails/?filters=basic&appids={app_id}"
+    response = http_get(url, timeout=5)
+    response.raise_for_status()
+    data = response.json()
+    return [int(dlc_id) for dlc_id in data[str(app_id)].get('data', {}).get('dlc', [])]
+
+# Raises on network errors, returns None for ids the store doesn't list
+def fetch_dlc_name(dlc_id):
+    dlc_url = f"https://store.steampowered.com/api/appdetails/?filters=basic&appids={dlc_id}"
+    dlc_response = http_get(dlc_url, timeout=3)
+    dlc_response.raise_for_status()
+    dlc_data = dlc_response.json()
     
-    try:
-        response = session.get(url, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        
-        dlc_ids = data[str(app_id)].get('data', {}).get('dlc', [])
-        if not dlc_ids:
-            return {}
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            def fetch_dlc_details(dlc_id):
-                dlc_url = f"https://store.steampowered.com/api/appdetails/?filters=basic&appids={dlc_id}"
+    if str(dlc_id) in dlc_data and dlc_data[str(dlc_id)].get('success'):
+        return dlc_data[str(dlc_id)].get('data', {}).get('name', f'DLC {dlc_id}')
+    return None
+
+# Look up names on the store, returns ({dlc id: name}, [failed ids]). Ids the store answers
+# for but doesn't list (delisted DLCs) are left out without counting as failures.
+def fetch_dlc_names(dlc_ids, progress=None, retries=DLC_RETRIES):
+    limit = AdaptiveLimit()
+    tracker = Progress(progress, len(dlc_ids))
+
+    def fetch(dlc_id):
+        try:
+            for attempt in range(retries + 1):
+                limit.acquire()
+                started = time.monotonic()
                 try:
-                    dlc_response = session.get(dlc_url, timeout=3)
-                    dlc_response.raise_for_status()
-                    dlc_data = dlc_response.json()
-                    
-                    if str(dlc_id) in dlc_data and dlc_data[str(dlc_id)].get('success'):
-                        dlc_name = dlc_data[str(dlc_id)].get('data', {}).get('name', f'DLC {dlc_id}')
-                        return (dlc_id, dlc_name)
+                    dlc_name = fetch_dlc_name(dlc_id)
                 except Exception:
-                    return None
-            
-            steam_dlcs = dict(filter(None, executor.map(fetch_dlc_details, dlc_ids)))
-        
-        return steam_dlcs
-    
+                    limit.release(time.monotonic() - started, False)
+                    continue
+                limit.release(time.monotonic() - started, True)
+                return dlc_id, dlc_name, True
+            return dlc_id, None, False
+        finally:
+            tracker.advance()
+
+    names = {}
+    failed = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DLC_MAX_WORKERS) as executor:
+        for dlc_id, dlc_name, ok in executor.map(fetch, dlc_ids):
+            if not ok:
+                failed.append(dlc_id)
+            elif dlc_name is not None:
+                names[dlc_id] = dlc_name
+    return names, failed
+
+# DLC names come from the local app index, only ids it doesn't know are looked up on the store.
+# Returns ({dlc id: name}, [failed ids]), dlcs is None when the store can't be reached and
+# nothing is known locally.
+def fetch_steam_dlcs(app_id, progress=None):
+    index = get_app_index()
+
+    try:
+        dlc_ids = fetch_dlc_ids(app_id)
+    except Exception:
+        # Store unreachable, fall back to what earlier runs recorded for this game
+        try:
+            return index.lookup_dlcs(app_id) or None, []
+        except Exception:
+            return None, []
+    if not dlc_ids:
+        return {}, []
+
+    try:
+        index.set_parent(app_id, dlc_ids)
+        known = index.lookup_dlcs(app_id, dlc_ids)
     except Exception:
+        known = {}
+
+    failed = []
+    unknown = [dlc_id for dlc_id in dlc_ids if dlc_id not in known]
+    if unknown:
+        names, failed = fetch_dlc_names(unknown, progress)
+        known.update(names)
+        for dlc_id, dlc_name in names.items():
+            index.add_app(dlc_id, dlc_name, 'dlc', int(app_id))
+
+    return {dlc_id: known[dlc_id] for dlc_id in dlc_ids if dlc_id in known}, failed
+
+# {dlc id: name} from the #dlc tab of a SteamDB app page
+def parse_steamdb_dlcs(markup, backend=None):
+    soup = parse_html(markup, section=("div", {"id": "dlc"}), backend=backend)
+    
+    dlc_section = soup.select_one("div#dlc.tab-pane.selected")
+    if not dlc_section:
         return {}
+    
+    table = dlc_section.select_one("table.table")
+    if not table:
+        return {}
+    
+    dlc_rows = table.select("tbody tr.app")
+    steamdb_dlcs = {}
+    
+    for row in dlc_rows:
+        try:
+            dlc_id_cell = row.select_one("td:nth-child(1)")
+            dlc_name_cell = row.select_one("td:nth-child(2)")
+            
+            if dlc_id_cell and dlc_name_cell:
+                dlc_id = int(dlc_id_cell.text().strip())
+                dlc_name = dlc_name_cell.text().strip()
+                steamdb_dlcs[dlc_id] = dlc_name
+        except Exception:
+            pass
+    
+    return steamdb_dlcs
 
-def fetch_steamdb_dlcs(session, app_id):
+# Returns None when SteamDB can't be reached or blocks the request
+def fetch_steamdb_dlcs(app_id):
     url = f"https://steamdb.info/app/{app_id}/dlc/"
     
     try:
-        response = session.get(url, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        dlc_section = soup.find("div", {"id": "dlc", "class": "tab-pane selected"})
-        if not dlc_section:
-            return {}
-        
-        table = dlc_section.find("table", {"class": "table"})
-        if not table:
-            return {}
-        
-        dlc_rows = table.select("tbody tr.app")
-        steamdb_dlcs = {}
-        
-        for row in dlc_rows:
-            try:
-                dlc_id_cell = row.select_one("td:nth-child(1)")
-                dlc_name_cell = row.select_one("td:nth-child(2)")
-                
-                if dlc_id_cell and dlc_name_cell:
-                    dlc_id = int(dlc_id_cell.text.strip())
-                    dlc_name = dlc_name_cell.text.strip()
-                    steamdb_dlcs[dlc_id] = dlc_name
-            except Exception:
-                pass
-        
-        return steamdb_dlcs
+        response = http_get(url, timeout=10)
+        response.raise_for_status()
+        return parse_steamdb_dlcs(response.content)
     
     except Exception:
-        return {}
-
-def fetch_dlc(app_id):
-    with create_session() as session:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            steamapi_future = executor.submit(fetch_steam_dlcs, session, app_id)
-            steamdb_future = executor.submit(fetch_steamdb_dlcs, session, app_id)
-            
-            steam_dlcs = steamapi_future.result() or {}
-            steamdb_dlcs = steamdb_future.result() or {}
+        return None
 
+def merge_dlcs(*all_dlc_sources):
     unq_dlcs = {}
-    all_dlc_sources = [steamdb_dlcs, steam_dlcs]
-    
     for source in all_dlc_sources:
         for dlc_id, dlc_name in source.items():
             if dlc_id not in unq_dlcs:
                 unq_dlcs[dlc_id] = dlc_name
+    return unq_dlcs
+
+# Fetch both sources and update the DLC cache, returns None when every source failed
+def refresh_dlc(app_id, progress=None):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        steamapi_future = executor.submit(fetch_steam_dlcs, app_id, progress)
+        steamdb_future = executor.submit(fetch_steamdb_dlcs, app_id)
+        steam_dlcs, failed = steamapi_future.result()
+        results = {"steamdb": steamdb_future.result(), "steam": steam_dlcs}
+
+    succeeded = {source: dlcs for source, dlcs in results.items() if dlcs is not None}
+    if not succeeded:
+        return None
+    unq_dlcs = merge_dlcs(*succeeded.values())
+
+    index = get_app_index()
+    cached = index.get_dlc_cache(app_id)
+    sources = cached[1] if cached else {}
+    now = time.time()
+    sources.update((source, now) for source in succeeded)
+
+    # A source that failed this time keeps contributing what it found before
+    if cached and len(succeeded) < len(results):
+        unq_dlcs = merge_dlcs(unq_dlcs, cached[0])
+
+    # Names SteamDB had are not failures, the rest are reported and retried on the next run
+    failed = [dlc_id for dlc_id in failed if dlc_id not in unq_dlcs]
+    if failed and progress:
+        progress(f"Could not resolve {len(failed)} DLC ids: {', '.join(map(str, sorted(failed)))}")
 
+    index.set_dlc_cache(app_id, unq_dlcs, sources, 0 if failed else now)
     return unq_dlcs
 
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+def refresh_dlc_in_background(app_id):
+    with _refreshing_lock:
+        if app_id in _refreshing:
+            return
+        _refreshing.add(app_id)
+
+    def run():
+        try:
+            refresh_dlc(app_id)
+        except Exception as e:
+            print(f"DLC refresh error: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(app_id)
+
+    threading.Thread(target=run, daemon=True).start()
+
+# Stale-while-revalidate: cached DLCs are returned right away, entries older than
+# max_age are refreshed in the background for the next run. progress receives status messages.
+def fetch_dlc(app_id, max_age=DLC_CACHE_TTL, progress=None):
+    app_id = int(app_id)
+    try:
+        cached = get_app_index().get_dlc_cache(app_id)
+    except Exception:
+        cached = None
+
+    if cached:
+        dlc_details, _, fetched = cached
+        if time.time() - fetched >= max_age:
+            refresh_dlc_in_background(app_id)
+        return dlc_details
+
+    return refresh_dlc(app_id, progress) or {}
+
+# Entries are written sorted by id to a temp file that replaces configs.app.ini once complete
 def create_dlc_config(game_dir, dlc_details):
     if not dlc_details:
         return
@@ -120,14 +271,20 @@ def create_dlc_config(game_dir, dlc_details):
     os.makedirs(settings_dir, exist_ok=True)
     
     config_path = os.path.join(settings_dir, "configs.app.ini")
+    tmp_path = f"{config_path}.tmp"
+    dlc_details = dict(dlc_details)
     
     try:
-        with open(config_path, 'w', encoding='utf-8') as config_file:
+        with open(tmp_path, 'w', encoding='utf-8') as config_file:
             config_file.write("[app::dlcs]\n")
             config_file.write("unlock_all=0\n")
             
-            for dlc_id, dlc_name in dlc_details.items():
+            for dlc_id in sorted(dlc_details):
+                dlc_name = " ".join(str(dlc_details[dlc_id]).splitlines())
                 config_file.write(f"{dlc_id} = {dlc_name}\n")
+        os.replace(tmp_path, config_path)
     
-    except Exception:
-        pass
\ No newline at end of file
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,143 @@
+import os
+import struct
+import threading
+import concurrent.futures
+from .fileUtils import JsonCache
+
+DLL_NAMES = ("steam_api.dll", "steam_api64.dll")
+DLL_CACHE_FILE = os.path.join("assets", "dll_cache.json")
+
+# Never searched: folders generated by us or by cracks, matched case-insensitively
+IGNORE_FOLDERS = {"gse", "crack"}
+# Asset-heavy folders that don't ship steam_api
+PRUNE_FOLDERS = {"movies", "videos", "cinematics", "audio", "sounds", "music", "textures", "paks", "shadercache", "_commonredist", "__pycache__", ".git"}
+MAX_DEPTH = 8
+SCAN_WORKERS = 8
+# Directories down to this depth become separate tasks, deeper ones are walked inside their task
+SPLIT_DEPTH = 2
+# Cached scans kept, least recently used are dropped
+CACHE_ENTRIES = 32
+
+PE_MACHINES = {0x014c: "x32", 0x8664: "x64", 0xaa64: "arm64"}
+
+# Architecture from the PE header, falls back to the file name
+def dll_arch(path):
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(4096)
+        pe_offset = struct.unpack_from("<I", header, 0x3c)[0]
+        if header[:2] == b"MZ" and header[pe_offset:pe_offset + 4] == b"PE\0\0":
+            machine = struct.unpack_from("<H", header, pe_offset + 4)[0]
+            if machine in PE_MACHINES:
+                return PE_MACHINES[machine]
+    except (OSError, struct.error):
+        pass
+    return "x64" if os.path.basename(path).lower() == "steam_api64.dll" else "x32"
+
+# One directory level: (its mtime, candidates, subdirectories to descend into)
+def _scan_dir(path, ignore):
+    candidates = []
+    subdirs = []
+    mtime = None
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.lower() not in ignore:
+                            subdirs.append(entry.path)
+                    elif entry.name.lower() in DLL_NAMES:
+                        stat = entry.stat()
+                        candidates.append({"path": entry.path, "size": stat.st_size, "mtime": stat.st_mtime_ns})
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return mtime, candidates, subdirs
+
+_cache = JsonCache()
+
+# A cached scan holds while no visited directory and no found DLL changed its mtime. Adding a
+# file or folder anywhere changes its parent's mtime, and a stat per directory is still far
+# cheaper than listing them all again. Directories are stored relative to the scanned folder.
+def _is_current(folder, entry):
+    try:
+        return all(os.stat(os.path.join(folder, path)).st_mtime_ns == mtime for path, mtime in entry["dirs"].items()) and \
+            all(os.stat(candidate["path"]).st_mtime_ns == candidate["mtime"] for candidate in entry["candidates"])
+    except OSError:
+        return False
+
+# Walk below path inside one task. Subdirectories at or above SPLIT_DEPTH are handed back
+# so they can run concurrently. Returns (visited {dir: mtime}, candidates, split subdirs).
+def _scan_tree(path, depth, ignore, max_depth, stop):
+    visited = {}
+    candidates = []
+    split = []
+    stack = [(path, depth)]
+    while stack and not stop.is_set():
+        current, current_depth = stack.pop()
+        mtime, found, subdirs = _scan_dir(current, ignore)
+        if mtime is not None:
+            visited[current] = mtime
+        candidates.extend(found)
+        if current_depth >= max_depth:
+            continue
+        for subdir in subdirs:
+            if current_depth + 1 <= SPLIT_DEPTH:
+                split.append((subdir, current_depth + 1))
+            else:
+                stack.append((subdir, current_depth + 1))
+    return visited, candidates, split
+
+# Concurrent scandir traversal that prunes ignored and asset folders and stops at max_depth.
+# Returns every steam_api(64).dll as {"path", "arch", "size", "mtime"}, shallowest first.
+# limit stops the search early once that many DLLs were found (such results aren't cached).
+def find_steam_dlls(folder, ignore=IGNORE_FOLDERS, max_depth=MAX_DEPTH, workers=SCAN_WORKERS, limit=None, cache_file=DLL_CACHE_FILE):
+    folder = os.path.abspath(folder)
+    ignore = {name.lower() for name in ignore} | PRUNE_FOLDERS
+    cache_key = f"{os.path.normcase(folder)}|{max_depth}|{','.join(sorted(ignore))}"
+
+    if cache_file and limit is None:
+        with _cache.lock:
+            entry = _cache.load(cache_file).get(cache_key)
+        if entry and _is_current(folder, entry):
+            with _cache.lock:
+                if next(reversed(_cache.data)) != cache_key:
+                    _cache.data[cache_key] = _cache.data.pop(cache_key)    # Most recently used last
+                    _cache.save(cache_file)
+            return entry["candidates"]
+
+    candidates = []
+    visited = {}
+    stop = threading.Event()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_tree, folder, 0, ignore, max_depth, stop)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                tree_visited, found, split = future.result()
+                visited.update(tree_visited)
+                candidates.extend(found)
+                for subdir, depth in split:
+                    pending.add(executor.submit(_scan_tree, subdir, depth, ignore, max_depth, stop))
+
+            if limit is not None and len(candidates) >= limit:
+                stop.set()
+                for future in pending:
+                    future.cancel()
+                break
+
+    for candidate in candidates:
+        candidate["arch"] = dll_arch(candidate["path"])
+    candidates.sort(key=lambda candidate: (candidate["path"].count(os.sep), candidate["path"].lower()))
+
+    if cache_file and limit is None:
+        with _cache.lock:
+            data = _cache.load(cache_file)
+            data.pop(cache_key, None)
+            data[cache_key] = {"dirs": {os.path.relpath(path, folder): mtime for path, mtime in visited.items()}, "candidates": candidates}
+            while len(data) > CACHE_ENTRIES:
+                del data[next(iter(data))]
+            _cache.save(cache_file)
+    return candidates[:limit] if limit else candidates
@@ -0,0 +1,127 @@
+import os
+import json
+import threading
+from .fileUtils import hash_file
+
+EMU_FOLDER = os.path.join("assets", "goldberg_emu")
+ARCH_DIRS = ("x32", "x64")
+
+def _join(rel_root, name):
+    return f"{rel_root}/{name}" if rel_root else name
+
+# Index of the extracted emulator release, persisted beside the folder (outside it, so writing
+# the manifest doesn't change the mtimes it records): directories by name in walk
+# order, files with size, mtime, sha256 and arch. Built once after extraction, every lookup
+# is a dict hit. Recorded directory mtimes are compared on load to catch later changes.
+class EmuManifest:
+    def __init__(self, emu_folder=EMU_FOLDER):
+        self.emu_folder = emu_folder
+        self.path = f"{os.path.normpath(emu_folder)}.manifest.json"
+        self.data = None
+        self._lock = threading.RLock()
+
+    def _abspath(self, rel_path):
+        return os.path.join(self.emu_folder, *rel_path.split("/")) if rel_path else self.emu_folder
+
+    def _relpath(self, path):
+        rel_path = os.path.relpath(os.path.abspath(path), os.path.abspath(self.emu_folder))
+        return "" if rel_path == "." else rel_path.replace(os.sep, "/")
+
+    def _is_current(self, data):
+        try:
+            return all(os.stat(self._abspath(rel_dir)).st_mtime_ns == mtime for rel_dir, mtime in data["dir_mtimes"].items())
+        except (OSError, KeyError):
+            return False
+
+    # Walk the tree once, files whose size and mtime didn't change keep their hash
+    def build(self):
+        with self._lock:
+            previous = (self.data or {}).get("files", {})
+            dirs = {}
+            dir_mtimes = {}
+            files = {}
+
+            for root, dirnames, filenames in os.walk(self.emu_folder):
+                rel_root = self._relpath(root)
+                dir_mtimes[rel_root] = os.stat(root).st_mtime_ns
+                for name in dirnames:
+                    dirs.setdefault(name, []).append(_join(rel_root, name))
+
+                for name in filenames:
+                    rel_path = _join(rel_root, name)
+                    stat = os.stat(os.path.join(root, name))
+                    old = previous.get(rel_path)
+                    if old and old["size"] == stat.st_size and old["mtime"] == stat.st_mtime_ns:
+                        sha256 = old["sha256"]
+                    else:
+                        sha256 = hash_file(os.path.join(root, name))
+                    arch = next((part for part in rel_root.split("/") if part in ARCH_DIRS), None)
+                    files[rel_path] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "sha256": sha256, "arch": arch}
+
+            self.data = {"dirs": dirs, "dir_mtimes": dir_mtimes, "files": files}
+            self._entries = set(files).union(*dirs.values())
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f)
+            os.replace(tmp_path, self.path)
+            return self.data
+
+    def load(self):
+        with self._lock:
+            if self.data is not None:
+                return self.data
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = None
+
+            if data and self._is_current(data):
+                self.data = data
+                self._entries = set(data["files"]).union(*data["dirs"].values())
+                return data
+            self.data = data    # Stale hashes are reused where size and mtime still match
+            return self.build()
+
+    # Same result as the old os.walk search: first directory named target_dir in walk order,
+    # or the extra_check entry inside it when present
+    def find_dir(self, target_dir, extra_check=None):
+        if not os.path.isdir(self.emu_folder):
+            return None
+
+        for attempt in range(2):
+            data = self.load()
+            matches = data["dirs"].get(target_dir)
+            if not matches:
+                return None
+
+            found_dir = self._abspath(matches[0])
+            if not os.path.isdir(found_dir):
+                self.build()    # Tree changed under the manifest
+                continue
+            if extra_check and _join(matches[0], extra_check) in self._entries:
+                return os.path.join(found_dir, extra_check)
+            return found_dir
+        return None
+
+    # {arch: dir} for the x32/x64 subfolders of target_dir
+    def variants(self, target_dir):
+        if not (found_dir := self.find_dir(target_dir)):
+            return {}
+        rel_dir = self._relpath(found_dir)
+        return {arch: self._abspath(_join(rel_dir, arch)) for arch in ARCH_DIRS if _join(rel_dir, arch) in self._entries}
+
+    # Recorded size/mtime/sha256/arch of a file inside the emulator folder
+    def file_info(self, path):
+        return self.load()["files"].get(self._relpath(path))
+
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+def get_emu_manifest(emu_folder=EMU_FOLDER):
+    key = os.path.abspath(emu_folder)
+    with _manifests_lock:
+        if key not in _manifests:
+            _manifests[key] = EmuManifest(emu_folder)
+        return _manifests[key]
@@ -0,0 +1,117 @@
+import os
+import shutil
+from .fileUtils import hash_file
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+FICLONE = 0x40049409    # Linux reflink ioctl (btrfs, XFS, bcachefs)
+COPY_RANGE_CHUNK = 64 * 1024 * 1024
+
+def same_content(src, dst, src_hash=None):
+    try:
+        if os.path.samefile(src, dst):
+            return True
+        if os.path.getsize(src) != os.path.getsize(dst):
+            return False
+    except OSError:
+        return False
+    return (src_hash or hash_file(src)) == hash_file(dst)
+
+def _reflink(src, dst):
+    if fcntl is None:
+        return False
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+            return True
+        except OSError:
+            return False
+
+def _hardlink(src, dst):
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        return False
+
+# In-kernel copy, no data passes through user space
+def _copy_range(src, dst):
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        remaining = os.fstat(src_file.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(src_file.fileno(), dst_file.fileno(), min(remaining, COPY_RANGE_CHUNK))
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            return False
+    return remaining == 0
+
+# Place src at dst the cheapest way the filesystem allows: reflink, hardlink (only with link=True,
+# the two paths then share one inode), copy_file_range, then a plain buffered copy.
+# dst is always replaced through a temp file, so an existing hardlink is never written through.
+# Returns "unchanged", "reflink", "hardlink", "copy_range" or "copy".
+def deploy_file(src, dst, link=False, src_hash=None):
+    if os.path.exists(dst) and same_content(src, dst, src_hash):
+        return "unchanged"
+
+    os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+    tmp_path = f"{dst}.deploy"
+    try:
+        if _reflink(src, tmp_path):
+            method = "reflink"
+        elif link and _hardlink(src, tmp_path):
+            method = "hardlink"
+        elif _copy_range(src, tmp_path):
+            method = "copy_range"
+        else:
+            shutil.copyfile(src, tmp_path)
+            method = "copy"
+
+        if method != "hardlink":
+            shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return method
+
+# Mirror src_dir into dst_dir file by file. prune removes files src_dir doesn't have,
+# skip_locked records files in use (PermissionError) as "locked" instead of failing.
+# Files named in exclude are left out.
+# Returns {relative path: result}.
+def deploy_tree(src_dir, dst_dir, link=False, prune=False, skip_locked=False, exclude=()):
+    results = {}
+    for root, dirs, files in os.walk(src_dir):
+        rel_root = os.path.relpath(root, src_dir)
+        target_root = os.path.normpath(os.path.join(dst_dir, rel_root))
+        os.makedirs(target_root, exist_ok=True)
+
+        for file_name in files:
+            if file_name in exclude:
+                continue
+            source_file = os.path.join(root, file_name)
+            rel_path = os.path.normpath(os.path.join(rel_root, file_name))
+            try:
+                results[rel_path] = deploy_file(source_file, os.path.join(target_root, file_name), link)
+            except PermissionError:
+                if not skip_locked:
+                    raise
+                results[rel_path] = "locked"
+
+    if prune:
+        for root, _, files in os.walk(dst_dir):
+            for file_name in files:
+                rel_path = os.path.normpath(os.path.relpath(os.path.join(root, file_name), dst_dir))
+                if rel_path not in results and file_name not in exclude:
+                    os.remove(os.path.join(root, file_name))
+    return results
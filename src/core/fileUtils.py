@@ -0,0 +1,38 @@
+import os
+import json
+import hashlib
+import threading
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# A JSON object kept in memory after the first read and written back atomically.
+# Callers hold lock around load, changes and save.
+class JsonCache:
+    def __init__(self, keep=None):
+        self.keep = keep    # Filter for the keys of a loaded file, drops entries of older formats
+        self.lock = threading.Lock()
+        self.data = None
+
+    # A missing or corrupt file starts an empty cache
+    def load(self, path):
+        if self.data is None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
+            except (OSError, ValueError):
+                self.data = {}
+            if self.keep:
+                self.data = {key: value for key, value in self.data.items() if self.keep(key)}
+        return self.data
+
+    def save(self, path):
+        tmp_path = f"{path}.tmp"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f)
+        os.replace(tmp_path, path)
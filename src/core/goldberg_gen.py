@@ -1,18 +1,16 @@
 import os
-import shutil
 import subprocess
+from .interfaceScanner import get_interfaces, write_interfaces, version_conflicts
+from .emuManifest import get_emu_manifest
+from .fileDeploy import deploy_file, deploy_tree
+from .dllFinder import dll_arch
+from .fileUtils import hash_file
 
 EMU_FOLDER = os.path.join("assets", "goldberg_emu")
 
+# Looked up in the emulator manifest instead of walking base_dir
 def find_dir(base_dir, target_dir, extra_check=None):
-    for root, dirs, _ in os.walk(base_dir):
-        if target_dir in dirs:
-            found_dir = os.path.join(root, target_dir)
-            if extra_check:
-                if extra_check in os.listdir(found_dir):
-                    return os.path.join(found_dir, extra_check)
-            return found_dir
-    return None
+    return get_emu_manifest(base_dir).find_dir(target_dir, extra_check)
 
 def modify_overlay_config(src_path, dst_path, disable_overlay):
     with open(src_path, 'r') as f:
@@ -29,7 +27,8 @@ def modify_overlay_config(src_path, dst_path, disable_overlay):
             else:
                 f.write(line)
 
-def generate_interfaces(dll_path):
+# gbe's generate_interfaces exe, writes steam_interfaces.txt next to the DLL (Windows only)
+def run_interfaces_tool(dll_path):
     tools_dir = find_dir(EMU_FOLDER, "tools", "generate_interfaces")
     dll_name = os.path.basename(dll_path).lower()
     generator_exe = f"generate_interfaces_{'x64' if dll_name == 'steam_api64.dll' else 'x32'}.exe"
@@ -38,7 +37,27 @@ def generate_interfaces(dll_path):
     
     return os.path.join(os.path.dirname(dll_path), "steam_interfaces.txt")
 
-def generate_emu(game_dir, app_id, dll_path, disable_overlay=False):
+# Scan the DLL in-process, the exe is only used when the scan finds nothing.
+# merge keeps the interfaces already written by another DLL sharing settings_dir.
+def generate_interfaces(dll_path, settings_dir, merge=False):
+    interfaces_path = os.path.join(settings_dir, "steam_interfaces.txt")
+    if not (interfaces := get_interfaces(dll_path)):
+        if os.name != 'nt':
+            raise RuntimeError(f"No Steam interfaces found in {os.path.basename(dll_path)}")
+        tool_output = run_interfaces_tool(dll_path)
+        with open(tool_output, 'r', encoding='utf-8') as f:
+            interfaces = f.read().split()
+        os.remove(tool_output)
+
+    if merge and os.path.exists(interfaces_path):
+        with open(interfaces_path, 'r', encoding='utf-8') as f:
+            interfaces = list(dict.fromkeys(f.read().split() + interfaces))
+        # DLLs from different SDKs in one folder, the emulator only uses one version of each interface
+        if conflicts := version_conflicts(interfaces):
+            print(f"Warning: DLLs sharing {settings_dir} use different interface versions: {', '.join('/'.join(listed) for listed in conflicts.values())}")
+    return write_interfaces(interfaces, interfaces_path)
+
+def generate_emu(game_dir, app_id, dll_path, disable_overlay=False, arch=None, merge_interfaces=False):
     try:
         if not dll_path or not os.path.exists(dll_path):
             return False
@@ -48,34 +67,31 @@ def generate_emu(game_dir, app_id, dll_path, disable_overlay=False):
 
         # Copy experimental files
         dll_name = os.path.basename(dll_path).lower()
-        exp_source = os.path.join(
-            find_dir(EMU_FOLDER, "experimental"),
-            "x64" if dll_name == "steam_api64.dll" else "x32"
-        )
+        manifest = get_emu_manifest(EMU_FOLDER)
+        exp_source = manifest.variants("experimental")[arch or dll_arch(dll_path)]
         
+        # Emulator files are never modified, so outputs share them through hardlinks
         for file in os.listdir(exp_source):
             if os.path.isfile(src_file := os.path.join(exp_source, file)):
-                shutil.copy2(src_file, os.path.join(game_dir, file))
+                info = manifest.file_info(src_file)
+                deploy_file(src_file, os.path.join(game_dir, file), link=True, src_hash=info and info["sha256"])
 
         # Backup original DLL
-        shutil.copy2(dll_path, os.path.join(game_dir, f"{dll_name}.o"))
+        deploy_file(dll_path, os.path.join(game_dir, f"{dll_name}.o"))
 
         # Create steam_appid.txt
         with open(os.path.join(settings_dir, "steam_appid.txt"), "w") as f:
             f.write(str(app_id))
 
-        # Generate and move interfaces file
-        shutil.move(generate_interfaces(dll_path), os.path.join(settings_dir, "steam_interfaces.txt"))
+        # Generate interfaces file
+        generate_interfaces(dll_path, settings_dir, merge_interfaces)
 
         # Copy fonts and sounds
         src_settings = os.path.join("assets", "steam_settings")
         if os.path.exists(src_settings):
             for folder in ['fonts', 'sounds']:
                 if os.path.exists(src_folder := os.path.join(src_settings, folder)):
-                    dst_folder = os.path.join(settings_dir, folder)
-                    if os.path.exists(dst_folder):
-                        shutil.rmtree(dst_folder)
-                    shutil.copytree(src_folder, dst_folder)
+                    deploy_tree(src_folder, os.path.join(settings_dir, folder), link=True, prune=True)
 
             # Handle overlay config
             if overlay_config := find_dir(EMU_FOLDER, "steam_settings.EXAMPLE", "configs.overlay.EXAMPLE.ini"):
@@ -85,4 +101,32 @@ def generate_emu(game_dir, app_id, dll_path, disable_overlay=False):
 
     except Exception as e:
         print(f"An error occurred: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+# One output folder per DLL location, laid out relative to the DLLs' common parent folder
+# (a single DLL keeps the flat layout). Identical DLLs share one interface scan through the
+# hash-keyed cache, DLLs in the same folder (steam_api + steam_api64) share one merged
+# steam_interfaces.txt. Returns ([(dll_path, output_dir), ...], common parent folder).
+def generate_emu_all(game_dir, app_id, dll_paths, disable_overlay=False):
+    dll_paths = [os.path.abspath(dll_path) for dll_path in dll_paths if os.path.exists(dll_path)]
+    if not dll_paths:
+        return [], None
+
+    base_dir = os.path.commonpath([os.path.dirname(dll_path) for dll_path in dll_paths])
+    distinct = {}
+    for dll_path in dll_paths:
+        distinct.setdefault(hash_file(dll_path), []).append(dll_path)
+    if len(dll_paths) > 1:
+        print(f"Generating for {len(dll_paths)} steam_api DLLs ({len(distinct)} distinct)")
+
+    outputs = []
+    for copies in distinct.values():
+        arch = dll_arch(copies[0])
+        for dll_path in copies:
+            output_dir = os.path.normpath(os.path.join(game_dir, os.path.relpath(os.path.dirname(dll_path), base_dir)))
+            merge = any(output[1] == output_dir for output in outputs)
+            if generate_emu(output_dir, app_id, dll_path, disable_overlay, arch, merge):
+                outputs.append((dll_path, output_dir))
+
+    outputs.sort(key=lambda output: dll_paths.index(output[0]))
+    return outputs, base_dir
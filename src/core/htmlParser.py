@@ -0,0 +1,70 @@
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Optional
+
+# Fastest available backend: selectolax (lexbor) > bs4 with lxml > bs4 with html.parser
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    BACKEND = "selectolax"
+except ImportError:
+    LexborHTMLParser = None
+    try:
+        import lxml  # noqa: F401
+        BACKEND = "lxml"
+    except ImportError:
+        BACKEND = "html.parser"
+
+class SoupNode:
+    def __init__(self, tag):
+        self.tag = tag
+
+    def select(self, selector: str) -> List["SoupNode"]:
+        return [SoupNode(tag) for tag in self.tag.select(selector)]
+
+    def select_one(self, selector: str) -> Optional["SoupNode"]:
+        tag = self.tag.select_one(selector)
+        return SoupNode(tag) if tag is not None else None
+
+    def text(self) -> str:
+        return self.tag.get_text()
+
+    def attr(self, name: str, default: str = "") -> str:
+        value = self.tag.get(name)
+        return default if value is None else value
+
+class LexborNode:
+    def __init__(self, node):
+        self.node = node
+
+    def select(self, selector: str) -> List["LexborNode"]:
+        return [LexborNode(node) for node in self.node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional["LexborNode"]:
+        node = self.node.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def text(self) -> str:
+        return self.node.text(deep=True)
+
+    def attr(self, name: str, default: str = "") -> str:
+        value = self.node.attributes.get(name)
+        return default if value is None else value
+
+# The strainer sees raw attribute strings, so a class has to be matched as one of its
+# whitespace-separated tokens ('class="achieveRow "' or "achievement achievement_broken")
+def _has_class(wanted):
+    return lambda value: value is not None and wanted in value.split()
+
+def _strainer_attrs(attrs):
+    return {key: _has_class(value) if key == "class" and isinstance(value, str) else value for key, value in attrs.items()}
+
+# section=(tag, attrs) limits the bs4 backends to the relevant part of the page. lexbor has no
+# partial parsing, selectolax always builds the whole tree (it is still the fastest backend).
+# backend overrides the detected one (benchmarks compare all of them)
+def parse_html(markup, section: Optional[tuple] = None, backend: Optional[str] = None):
+    backend = backend or BACKEND
+    if backend == "selectolax":
+        parser = LexborHTMLParser(markup)
+        return LexborNode(parser.root if parser.root is not None else parser.body)
+
+    parse_only = SoupStrainer(section[0], _strainer_attrs(section[1])) if section else None
+    return SoupNode(BeautifulSoup(markup, backend, parse_only=parse_only))
@@ -0,0 +1,172 @@
+import os
+import hashlib
+import threading
+from collections import deque
+from contextlib import contextmanager
+from curl_cffi import requests
+
+DEFAULT_TIMEOUT = 30
+
+# Override with a local stand-in server to exercise the Web API offline
+STEAM_API_URL = os.environ.get("GSE_STEAM_API_URL", "https://api.steampowered.com").rstrip('/')
+
+PROFILES = {
+    "steam": {
+        "impersonate": "safari15_5",
+        "headers": { "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.5 Safari/605.1.15", "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8", "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8", "Accept-Encoding": "gzip, deflate, br" }
+    },
+    "steamdb": {
+        "impersonate": "chrome110",
+        "headers": { "authority": "steamdb.info", "accept": "text/html", "accept-encoding": "gzip, deflate, br, zstd", "accept-language": "en", "dnt": "1", "priority": "u=1, i", "sec-ch-ua": '"Not A(Brand";v="8", "Chromium";v="132", "Google Chrome";v="132"', "sec-ch-ua-mobile": "?0", "sec-ch-ua-platform": '"Windows"', "sec-fetch-dest": "empty", "sec-fetch-mode": "cors", "sec-fetch-site": "same-origin", "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36", "x-requested-with": "XMLHttpRequest" }
+    }
+}
+
+def configure_base_session(session: requests.Session):
+    session.cipher = ("TLS_AES_128_GCM_SHA256:TLS_AES_256_GCM_SHA384:TLS_CHACHA20_POLY1305_SHA256:TLS_ECDHE_ECDSA_WITH_AES_256_GCM_SHA384:TLS_ECDHE_ECDSA_WITH_AES_128_GCM_SHA256:TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384:TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256:TLS_RSA_WITH_AES_256_GCM_SHA384:TLS_RSA_WITH_AES_128_GCM_SHA256:TLS_RSA_WITH_AES_256_CBC_SHA:TLS_RSA_WITH_AES_128_CBC_SHA:TLS_ECDHE_ECDSA_WITH_3DES_EDE_CBC_SHA:TLS_ECDHE_RSA_WITH_3DES_EDE_CBC_SHA:TLS_RSA_WITH_3DES_EDE_CBC_SHA")
+    session.curve = "X25519:P-256:P-384:P-521"
+    session.sign_algo = ("ecdsa_secp256r1_sha256,rsa_pss_rsae_sha256,rsa_pkcs1_sha256,ecdsa_secp384r1_sha384,ecdsa_sha1,rsa_pss_rsae_sha384,rsa_pss_rsae_sha384,rsa_pkcs1_sha384,rsa_pss_rsae_sha512,rsa_pkcs1_sha512,rsa_pkcs1_sha1")
+    return session
+
+def create_session(profile: str = "steam") -> requests.Session:
+    config = PROFILES[profile]
+    session = requests.Session(impersonate=config["impersonate"], headers=config["headers"], timeout=DEFAULT_TIMEOUT)
+    return configure_base_session(session)
+
+# Async sessions are bound to their event loop, so they are created per run instead of pooled
+def create_async_session(profile: str = "steam", max_clients: int = 10) -> requests.AsyncSession:
+    config = PROFILES[profile]
+    return requests.AsyncSession(impersonate=config["impersonate"], headers=config["headers"], timeout=DEFAULT_TIMEOUT, max_clients=max_clients)
+
+# Idle sessions per profile. Each one keeps its curl connection cache (keep-alive,
+# HTTP/2, TLS sessions per host) alive between requests, runs and threads.
+_idle_sessions = {profile: deque() for profile in PROFILES}
+_all_sessions = []
+_sessions_lock = threading.Lock()
+
+@contextmanager
+def pooled_session(profile: str = "steam"):
+    try:
+        session = _idle_sessions[profile].pop()
+    except IndexError:
+        session = create_session(profile)
+        with _sessions_lock:
+            _all_sessions.append(session)
+
+    # A session is only ever handed to one thread at a time
+    try:
+        yield session
+    finally:
+        _idle_sessions[profile].append(session)
+
+def http_get(url: str, profile: str = "steam", **kwargs) -> requests.Response:
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    with pooled_session(profile) as session:
+        return session.get(url, **kwargs)
+
+def close_sessions():
+    with _sessions_lock:
+        for session in _all_sessions:
+            session.close()
+        _all_sessions.clear()
+        for idle in _idle_sessions.values():
+            idle.clear()
+
+# Streamed downloads go to "<path>.part" and are renamed into place only once complete.
+# The ETag or Last-Modified of the response that started a .part file is kept beside it,
+# a resume sends it as If-Range so a changed file (a new release behind a "latest" URL)
+# comes back whole with 200 instead of its tail being appended.
+def _prepare_part(path: str, resume: bool):
+    part_path = f"{path}.part"
+    validator = None
+    if resume and os.path.exists(part_path):
+        try:
+            with open(f"{part_path}.validator", 'r', encoding='utf-8') as f:
+                validator = f.read().strip()
+        except OSError:
+            pass
+
+    # Without a validator there is no way to tell whether the file changed, so start over
+    offset = os.path.getsize(part_path) if validator else 0
+    headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+    return part_path, offset, headers
+
+# Open the .part file for a response, recording the validator of a fresh download
+def _open_part(part_path: str, response):
+    if response.status_code == 206:
+        return open(part_path, 'ab')
+
+    etag = response.headers.get("ETag")
+    validator = etag if etag and not etag.startswith("W/") else response.headers.get("Last-Modified")
+    if validator:
+        with open(f"{part_path}.validator", 'w', encoding='utf-8') as f:
+            f.write(validator)
+    elif os.path.exists(f"{part_path}.validator"):
+        os.remove(f"{part_path}.validator")
+    return open(part_path, 'wb')
+
+def _discard_part(part_path: str):
+    for stale_path in (part_path, f"{part_path}.validator"):
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+def _expected_length(response, offset: int):
+    if response.headers.get("Content-Encoding") or "Content-Length" not in response.headers:
+        return None
+    return int(response.headers["Content-Length"]) + (offset if response.status_code == 206 else 0)
+
+def _finish_part(part_path: str, path: str, expected_length, sha256):
+    size = os.path.getsize(part_path)
+    if expected_length is not None and size != expected_length:
+        raise RuntimeError(f"Incomplete download of {os.path.basename(path)}: {size}/{expected_length} bytes")
+
+    if sha256:
+        digest = hashlib.sha256()
+        with open(part_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        if digest.hexdigest().lower() != sha256.lower():
+            _discard_part(part_path)
+            raise RuntimeError(f"Checksum mismatch for {os.path.basename(path)}")
+
+    os.replace(part_path, path)
+    _discard_part(part_path)
+
+# Both return the (closed) response, its status_code and headers stay readable
+def download_file(session: requests.Session, url: str, path: str, sha256: str = None, resume: bool = True, headers: dict = None, chunk_size: int = 65536) -> requests.Response:
+    part_path, offset, range_headers = _prepare_part(path, resume)
+    response = session.get(url, headers={**(headers or {}), **range_headers}, stream=True)
+    try:
+        if response.status_code == 416 and offset:
+            # Stale .part file, start over
+            response.close()
+            _discard_part(part_path)
+            return download_file(session, url, path, sha256, False, headers, chunk_size)
+        if response.status_code not in (200, 206):
+            return response
+
+        with _open_part(part_path, response) as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+        _finish_part(part_path, path, _expected_length(response, offset), sha256)
+        return response
+    finally:
+        response.close()
+
+async def download_file_async(session: requests.AsyncSession, url: str, path: str, sha256: str = None, resume: bool = True, headers: dict = None) -> requests.Response:
+    part_path, offset, range_headers = _prepare_part(path, resume)
+    response = await session.get(url, headers={**(headers or {}), **range_headers}, stream=True)
+    try:
+        if response.status_code == 416 and offset:
+            await response.aclose()
+            _discard_part(part_path)
+            return await download_file_async(session, url, path, sha256, False, headers)
+        if response.status_code not in (200, 206):
+            return response
+
+        with _open_part(part_path, response) as f:
+            async for chunk in response.aiter_content():
+                f.write(chunk)
+        _finish_part(part_path, path, _expected_length(response, offset), sha256)
+        return response
+    finally:
+        await response.aclose()
@@ -0,0 +1,70 @@
+import os
+import json
+import time
+import shutil
+import threading
+
+ICON_CACHE_DIR = os.path.abspath(os.path.join("assets", "icon_cache"))
+REVALIDATE_AFTER = 7 * 24 * 60 * 60
+
+# Cross-game store of achievement icons, keyed by the Steam image hash file name.
+# index.json keeps the validators (ETag/Last-Modified) and last check time per icon.
+class IconCache:
+    def __init__(self, cache_dir=ICON_CACHE_DIR, revalidate_after=REVALIDATE_AFTER):
+        self.cache_dir = cache_dir
+        self.revalidate_after = revalidate_after
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def path(self, name):
+        return os.path.join(self.cache_dir, name)
+
+    def is_fresh(self, name):
+        entry = self.index.get(name)
+        return bool(entry) and os.path.exists(self.path(name)) and time.time() - entry.get("checked", 0) < self.revalidate_after
+
+    def conditional_headers(self, name):
+        entry = self.index.get(name)
+        if not entry or not os.path.exists(self.path(name)):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # Record a 200 or 304 response for a cached icon
+    def update(self, name, response_headers):
+        entry = self.index.setdefault(name, {})
+        entry["checked"] = time.time()
+        if etag := response_headers.get("ETag"):
+            entry["etag"] = etag
+        if last_modified := response_headers.get("Last-Modified"):
+            entry["last_modified"] = last_modified
+
+    # Hardlink into the output folder, copy when the filesystem doesn't allow it
+    def link_into(self, name, dest_path):
+        if os.path.exists(dest_path):
+            if os.path.samefile(self.path(name), dest_path):
+                return
+            os.remove(dest_path)
+        try:
+            os.link(self.path(name), dest_path)
+        except OSError:
+            shutil.copyfile(self.path(name), dest_path)
+
+    def save(self):
+        with self._lock:
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
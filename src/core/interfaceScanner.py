@@ -0,0 +1,61 @@
+import os
+import re
+import mmap
+import hashlib
+from .fileUtils import JsonCache
+
+INTERFACE_CACHE_FILE = os.path.join("assets", "interface_cache.json")
+
+# Interface version strings as matched by gbe's generate_interfaces tool, folded into one
+# pattern so the DLL is scanned in a single pass. Old SDKs name the controller interface without a number.
+INTERFACE_PATTERN = re.compile(
+    rb'Steam(?:Client|GameServerStats|GameServer|MatchMakingServers|MatchMaking|MatchGameSearch|User|Friends|Utils'
+    rb'|NetworkingSockets|NetworkingUtils|NetworkingMessages|Networking|MasterServerUpdater|Controller|Input|Parties'
+    rb'|GameCoordinator)\d+'
+    rb'|STEAM(?:USERSTATS_INTERFACE_VERSION|APPS_INTERFACE_VERSION|REMOTESTORAGE_INTERFACE_VERSION|SCREENSHOTS_INTERFACE_VERSION'
+    rb'|HTTP_INTERFACE_VERSION|UNIFIEDMESSAGES_INTERFACE_VERSION|UGC_INTERFACE_VERSION|APPLIST_INTERFACE_VERSION'
+    rb'|MUSICREMOTE_INTERFACE_VERSION|MUSIC_INTERFACE_VERSION|HTMLSURFACE_INTERFACE_VERSION_|INVENTORY_INTERFACE_V'
+    rb'|VIDEO_INTERFACE_V|PARENTALSETTINGS_INTERFACE_VERSION|REMOTEPLAY_INTERFACE_VERSION|APPTICKET_INTERFACE_VERSION'
+    rb'|TIMELINE_INTERFACE_V|GAMERECORDING_INTERFACE_V)\d+'
+    rb'|STEAMCONTROLLER_INTERFACE_VERSION\d*'
+)
+
+# Part of every cache key, bumped whenever INTERFACE_PATTERN changes so results of an older pattern are dropped
+PATTERN_VERSION = 2
+
+_cache = JsonCache(keep=lambda key: key.startswith(f"{PATTERN_VERSION}:"))
+
+def scan_interfaces(data):
+    return list(dict.fromkeys(match.decode('ascii') for match in INTERFACE_PATTERN.findall(data)))
+
+# Identical steam_api DLLs are shared by many games, so results are cached by content hash.
+# Hash and scan share one memory map of the DLL.
+def get_interfaces(dll_path, cache_file=INTERFACE_CACHE_FILE):
+    # mmap refuses empty files, and an empty DLL has nothing to scan
+    if os.path.getsize(dll_path) == 0:
+        return []
+
+    with open(dll_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        key = f"{PATTERN_VERSION}:{hashlib.sha256(mm).hexdigest()}"
+        with _cache.lock:
+            if (cached := _cache.load(cache_file).get(key)) is not None:
+                return cached
+        interfaces = scan_interfaces(mm)
+
+    if interfaces:
+        with _cache.lock:
+            _cache.data[key] = interfaces
+            _cache.save(cache_file)
+    return interfaces
+
+# {interface: [versions]} for every interface listed in more than one version
+def version_conflicts(interfaces):
+    versions = {}
+    for interface in interfaces:
+        versions.setdefault(interface.rstrip("0123456789"), []).append(interface)
+    return {base: listed for base, listed in versions.items() if len(listed) > 1}
+
+def write_interfaces(interfaces, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("".join(f"{interface}\n" for interface in interfaces))
+    return path
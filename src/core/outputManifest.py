@@ -0,0 +1,71 @@
+import os
+import json
+import time
+import hashlib
+from .fileUtils import hash_file
+
+MANIFEST_NAME = "achievements.manifest.json"
+
+def hash_entry(entry):
+    return hashlib.sha256(json.dumps(entry, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+# What the last run wrote into an output folder: source, fetch time, a hash of
+# achievements.json, one per achievement and one per icon. Re-runs diff against it
+# and only touch what changed.
+class OutputManifest:
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.image_folder = os.path.join(output_dir, "images")
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+        self.achievements = self.data.get("achievements", {})
+        self.icons = self.data.get("icons", {})
+
+    @property
+    def digest(self):
+        return self.data.get("digest")
+
+    # Icon from a previous run that is still on disk as recorded
+    def has_icon(self, name):
+        entry = self.icons.get(name)
+        try:
+            return bool(entry) and os.path.getsize(os.path.join(self.image_folder, name)) == entry["size"]
+        except OSError:
+            return False
+
+    # hashes: {api name: entry hash}, returns (added, changed, removed) api names
+    def diff(self, hashes):
+        added = [name for name in hashes if name not in self.achievements]
+        changed = [name for name, value in hashes.items() if name in self.achievements and self.achievements[name] != value]
+        removed = [name for name in self.achievements if name not in hashes]
+        return added, changed, removed
+
+    # Only icons recorded by a previous run are removed, anything else in images/ is left alone
+    def remove_orphans(self, icon_names):
+        orphans = set(self.icons) - set(icon_names)
+        for name in orphans:
+            try:
+                os.remove(os.path.join(self.image_folder, name))
+            except FileNotFoundError:
+                pass
+        return orphans
+
+    def icon_entry(self, name):
+        if self.has_icon(name):
+            return self.icons[name]
+        path = os.path.join(self.image_folder, name)
+        return {"sha256": hash_file(path), "size": os.path.getsize(path)}
+
+    def save(self, source, digest, hashes, icons):
+        self.data = {"source": source, "fetched": int(time.time()), "digest": digest, "achievements": hashes, "icons": icons}
+        self.achievements, self.icons = hashes, icons
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -1,11 +1,14 @@
 import os
 import subprocess
-from curl_cffi import requests
+from .httpClient import pooled_session, download_file
+from .emuManifest import get_emu_manifest
 
-# Supress subprocess window
-startupinfo = subprocess.STARTUPINFO()
-startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-startupinfo.wShowWindow = subprocess.SW_HIDE
+# Supress subprocess window (Windows only, the module is also imported on Linux build boxes)
+startupinfo = None
+if os.name == 'nt':
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
 
 SEVENZIP_PATH = os.path.join("assets", "7zip", "7za.exe")
 GOLDBERG_URL = "https://github.com/0xNullPointers/gbe_fork/releases/latest/download/emu-win-release.7z"
@@ -16,23 +19,26 @@ ARCHIVE_NAME = "emu-win-release.7z"
 # print(f"EMU Dir: {EMU_FOLDER}")
 # print(f"7z Path: {SEVENZIP_PATH}")
 
+# Extracted emulator present, a leftover archive or .part file alone doesn't count
+def is_emu_ready():
+    if not os.path.isdir(EMU_FOLDER):
+        return False
+    return any(not entry.startswith(ARCHIVE_NAME) for entry in os.listdir(EMU_FOLDER))
+
 # Setting-Up Latest Emulator
 def download_goldberg():
     os.makedirs(EMU_FOLDER, exist_ok=True)
     archive_path = os.path.join(EMU_FOLDER, ARCHIVE_NAME)
     
+    # Only complete downloads are renamed to archive_path
     if os.path.exists(archive_path):
         return archive_path
     
-    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.5 Safari/605.1.15"}
-    
     try:
-        with requests.Session(headers=headers) as session:
-            response = session.get(GOLDBERG_URL)
-            response.raise_for_status()
-            
-            with open(archive_path, 'wb') as f:
-                f.write(response.content)
+        with pooled_session("steam") as session:
+            response = download_file(session, GOLDBERG_URL, archive_path)
+        if response.status_code not in (200, 206):
+            raise RuntimeError(f"HTTP {response.status_code}")
         
         print("Download completed.")
         return archive_path
@@ -43,9 +49,12 @@ def download_goldberg():
 def extract_archive(archive_path):
     try:
         cmd = [SEVENZIP_PATH, 'x', f'-o{EMU_FOLDER}', '-y', archive_path]
-        subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        result = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"7-Zip exited with code {result.returncode}")
         
         os.remove(archive_path)
+        get_emu_manifest(EMU_FOLDER).build()
         print("Extraction completed.")
         
     except Exception as e:
@@ -312,6 +312,14 @@ Click Generate to start the process."""
         except Exception as e:
             self.write_output(f"Failed to load username: {str(e)}")
 
+    def get_api_key(self):
+        return self.config.get('Settings', 'steam_api_key', fallback='').strip() or None
+
+    # First language is the one the game runs in, the rest are only added to achievements
+    def get_languages(self):
+        languages = self.config.get('Settings', 'languages', fallback='english')
+        return [language.strip().lower() for language in languages.split(',') if language.strip()] or ['english']
+
     # Generate configs.main.ini and configs.user.ini
     def create_user_config(self, settings_dir: str):
         user_account = self.user_account_entry.text().strip()
@@ -327,7 +335,7 @@ Click Generate to start the process."""
 
         config_content = ""
         if user_account:
-            config_content += f"[user::general]\naccount_name={user_account}\nlanguage=english\n"
+            config_content += f"[user::general]\naccount_name={user_account}\nlanguage={self.get_languages()[0]}\n"
         if use_local_save:
             config_content += "[user::saves]\nlocal_save_path=./GSE Saves\n"
         if config_content and not self.achievements_only.isChecked():
@@ -372,9 +380,10 @@ Click Generate to start the process."""
 
     # Process input
     def process_input(self, app_id, game_name):
-        from src.core.appID_finder import get_steam_app_by_id, get_steam_app_by_name    # import
+        from src.core.appID_finder import get_steam_app_by_id, get_steam_app_by_name, refresh_app_index    # import
 
         result = {}
+        refresh_app_index(self.get_api_key())    # Picks up new releases in the background
         
         if app_id:
             self.write_output("Parsing AppID...")
@@ -388,16 +397,15 @@ Click Generate to start the process."""
             app_info = get_steam_app_by_name(game_name)
             if not app_info or 'appid' not in app_info:
                 raise Exception(f"Could not find AppID for '{game_name}'")
-            result = {'game_name': game_name, 'app_id': str(app_info['appid'])}
+            result = {'game_name': app_info.get('name', game_name), 'app_id': str(app_info['appid'])}
         
         return result
 
     # Setup Goldberg Emu
     def setup_emu(self):
-        from src.core.setupEmu import download_goldberg, extract_archive    # import
+        from src.core.setupEmu import download_goldberg, extract_archive, is_emu_ready    # import
         
-        EMU_FOLDER = os.path.join("assets", "goldberg_emu")
-        if os.path.exists(EMU_FOLDER):
+        if is_emu_ready():
             return True
             
         self.write_output("Setting up GBE(Detanup01 fork)...")
@@ -413,7 +421,8 @@ Click Generate to start the process."""
     # Generate files
     def generate_files(self, app_id, file_path, use_steam):
         from src.core.appID_finder import get_steam_app_by_id    # import
-        import shutil
+        from src.core.fileDeploy import deploy_tree    # import
+        from src.core.outputManifest import MANIFEST_NAME    # import
         
         app_index = get_steam_app_by_id(app_id)
         if not app_index or 'name' not in app_index:
@@ -425,34 +434,28 @@ Click Generate to start the process."""
         
         try:
             os.makedirs(game_dir, exist_ok=True)
-            os.makedirs(settings_dir, exist_ok=True)
             
-            dll_path = None
+            outputs, base_dir = [], None
             if not self.achievements_only.isChecked():
-                # Setup emulator
-                dll_path = self._generate_core_files(game_dir, app_id, file_path)
+                # Setup emulator, one output folder per DLL location
+                outputs, base_dir = self._generate_core_files(game_dir, app_id, file_path)
+                settings_dir = os.path.join(outputs[0][1], "steam_settings")
+            os.makedirs(settings_dir, exist_ok=True)
             
             self._generate_achievements(settings_dir, app_id, use_steam)
             self.create_user_config(settings_dir)
             
+            # Other DLL folders share the fetched settings, each keeps its own interfaces file.
+            # The achievements manifest only tracks the folder it was fetched into. Pruning drops
+            # icons the primary folder removed as orphans.
+            for output_dir in list(dict.fromkeys(output_dir for _, output_dir in outputs))[1:]:
+                deploy_tree(settings_dir, os.path.join(output_dir, "steam_settings"), link=True, prune=True, exclude={"steam_interfaces.txt", MANIFEST_NAME})
+            
             # Copying files after all files are generated
-            if self.auto_replace.isChecked() and dll_path:
+            if self.auto_replace.isChecked() and base_dir:
                 try:
-                    target_dir = os.path.dirname(dll_path)
-                    for root, dirs, files in os.walk(game_dir):
-                        rel_path = os.path.relpath(root, game_dir)
-                        for dir_name in dirs:
-                            target_path = os.path.join(target_dir, rel_path, dir_name)
-                            os.makedirs(target_path, exist_ok=True)
-                        for file_name in files:
-                            source_file = os.path.join(root, file_name)
-                            target_file = os.path.join(target_dir, rel_path, file_name)
-                            try:
-                                if os.path.exists(target_file):
-                                    os.remove(target_file)
-                            except PermissionError:
-                                continue
-                            shutil.copy2(source_file, target_file)
+                    # Unchanged files are skipped, files in use are left alone, the manifest stays in the output
+                    deploy_tree(game_dir, base_dir, skip_locked=True, exclude={MANIFEST_NAME})
                     self.write_output("Files copied to Game dir successfully!")
                 except Exception as e:
                     self.write_output(f"Warning: Failed to copy files: {str(e)}")
@@ -464,59 +467,44 @@ Click Generate to start the process."""
 
     # Generate Goldberg emu files
     def _generate_core_files(self, game_dir, app_id, file_path):
-        from src.core.goldberg_gen import generate_emu    # import
+        from src.core.goldberg_gen import generate_emu_all    # import
         from src.core.dlc_gen import fetch_dlc, create_dlc_config    # import
+        from src.core.dllFinder import find_steam_dlls    # import
         
         self.write_output("Generating GSE...")
         
-        # Resolve DLL path
-        ignore_folders = ['gse', 'crack']
-        ignore_folders = [folder.lower() for folder in ignore_folders]
-        file_path = os.path.abspath(file_path)
-        dll_path = None
-        for root, dirs, files in os.walk(file_path, topdown=True):
-            dirs[:] = [d for d in dirs if d.lower() not in ignore_folders]
-            if 'steam_api.dll' in files:    # Check for steam_api.dll
-                dll_path = os.path.join(root, 'steam_api.dll')
-            if 'steam_api64.dll' in files:    # If no steam_api.dll, check for steam_api64.dll
-                dll_path = os.path.join(root, 'steam_api64.dll')
-        
-        if not dll_path:
+        # Every steam_api(64).dll in the game folder gets the emulator beside it
+        candidates = find_steam_dlls(file_path)
+        if not candidates:
             raise Exception("Could not find steam_api.dll or steam_api64.dll")
+        if len(candidates) > 1:
+            self.write_output(f"Found {len(candidates)} steam_api DLLs")
             
-        if not generate_emu(game_dir, app_id, dll_path, self.disable_overlay.isChecked()):
+        outputs, base_dir = generate_emu_all(game_dir, app_id, [candidate["path"] for candidate in candidates], self.disable_overlay.isChecked())
+        if not outputs:
             raise Exception("Failed to generate Goldberg emu files")
         
+        # DLCs are fetched once and shared with the other DLL folders
         self.write_output("Fetching DLCs...")
-        dlc_details = fetch_dlc(app_id)
-        create_dlc_config(game_dir, dlc_details)
-        return dll_path
+        dlc_details = fetch_dlc(app_id, progress=self.write_output)
+        create_dlc_config(outputs[0][1], dlc_details)
+        return outputs, base_dir
                 
     # Fetch and generate achievements.json
     def _generate_achievements(self, settings_dir, app_id, use_steam):
         self.write_output("Fetching Achievements...")
-        original_cwd = os.getcwd()
-        
-        try:
-            os.chdir(settings_dir)
-            achievements = self._fetch_achievements(app_id, use_steam)
-            if not achievements:
-                self.write_output("No achievements found.")
-        finally:
-            os.chdir(original_cwd)
-
-    def _fetch_achievements(self, app_id, use_steam):
-        from src.core.achievements import fetch_from_steamcommunity, fetch_from_steamdb    # import
-        
-        if use_steam:
-            try:
-                return fetch_from_steamcommunity(app_id, silent=True)
-            except Exception:
-                return None
+        achievements = self._fetch_achievements(app_id, use_steam, settings_dir)
+        if not achievements:
+            self.write_output("No achievements found.")
+
+    def _fetch_achievements(self, app_id, use_steam, output_dir):
+        from src.core.achievements import fetch_achievements, default_sources    # import
         
+        # Sources race, only the winner writes into output_dir
+        api_key = self.get_api_key()
+        sources = default_sources(use_steam, api_key)
         try:
-            achievements = fetch_from_steamdb(app_id, silent=True) or fetch_from_steamcommunity(app_id, silent=True)
-            return achievements
+            return fetch_achievements(app_id, output_dir, sources, silent=True, api_key=api_key, languages=self.get_languages(), progress=self.write_output)
         except Exception:
             return None
 
@@ -598,4 +586,8 @@ Click Generate to start the process."""
         
         # Cleanup thread manager in background
         if self._thread_manager is not None:
-            QTimer.singleShot(0, self._thread_manager.cleanup)
\ No newline at end of file
+            QTimer.singleShot(0, self._thread_manager.cleanup)
+
+        # Close pooled HTTP connections
+        if 'src.core.httpClient' in sys.modules:
+            sys.modules['src.core.httpClient'].close_sessions()
\ No newline at end of file
@@ -0,0 +1,129 @@
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.appID_finder import AppIndex, iter_app_list
+
+# Benchmark of the first-run app list ingest: the streamed, batched AppIndex.ingest path
+# against the old response.json() + one INSERT per row, on a recorded or generated
+# ISteamApps/GetAppList document. The NOCASE name index and the FTS search index are built
+# in the background after the ingest, "search" times that build on its own.
+#
+#   python tools/bench_ingest.py --write-fixture applist.json --apps 250000
+#   python tools/bench_ingest.py applist.json
+
+NAME_WORDS = ("Dark", "Souls", "Space", "Simulator", "Tycoon", "Legends", "Tales", "of", "the", "Ünïcödé", "Café", "東方", "ゲーム", "Ярость", "Quest", "Night", "Zero", "II", "III", "2077")
+NAME_SUFFIXES = ("", "", "", " Soundtrack", " - Deluxe Edition", "™", "®", ": Director's Cut", " (GOTY)", " Demo", ' "Beta"', " \\ Test")
+CHUNK_SIZE = 65536
+
+# Shaped like the real document: increasing appids with gaps, mixed scripts, trademark signs,
+# quotes and backslashes that need JSON escapes, and some rows without a name
+def write_fixture(path, count, seed=0):
+    rng = random.Random(seed)
+    apps = []
+    appid = 0
+    for _ in range(count):
+        appid += rng.choice((10, 10, 20, 30, 70, 1000))
+        name = "" if rng.random() < 0.05 else " ".join(rng.choices(NAME_WORDS, k=rng.randint(1, 5))) + rng.choice(NAME_SUFFIXES)
+        apps.append({"appid": appid, "name": name})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"applist": {"apps": apps}}, f, ensure_ascii=False)
+    return count
+
+def read_chunks(path):
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+def ingest_streamed(path, db_file):
+    index = AppIndex(db_file, snapshot_file=None)
+    try:
+        index.ingest(iter_app_list(read_chunks(path)))
+        return index.conn.execute('SELECT COUNT(*) FROM apps').fetchone()[0]
+    finally:
+        index.close()
+
+# Background index build, the first fuzzy name lookup waits for it
+def time_search_index(path):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index = AppIndex(os.path.join(temp_dir, "steam_data.db"), snapshot_file=None)
+        try:
+            index.ingest(iter_app_list(read_chunks(path)))
+            started = time.perf_counter()
+            index.ensure_search_index()
+            elapsed = time.perf_counter() - started
+        finally:
+            index.close()
+    print(f"{'search':<10} {'':>8}       once {elapsed:6.2f} s  (background, first fuzzy lookup waits)")
+
+# What get_steam_data did before: the whole document in memory, one execute per row
+def ingest_baseline(path, db_file):
+    with open(path, 'rb') as f:
+        apps = json.loads(f.read())['applist']['apps']
+    conn = sqlite3.connect(db_file)
+    try:
+        cursor = conn.cursor()
+        cursor.execute('''CREATE TABLE IF NOT EXISTS apps (appid INTEGER PRIMARY KEY, name TEXT)''')
+        for app in apps:
+            cursor.execute('INSERT OR IGNORE INTO apps (appid, name) VALUES (?, ?)', (app['appid'], app['name']))
+        conn.commit()
+        return cursor.execute('SELECT COUNT(*) FROM apps').fetchone()[0]
+    finally:
+        conn.close()
+
+# Timed rounds run untraced, tracemalloc slows allocation-heavy code down too much; one
+# extra traced round measures the peak
+def measure(label, ingest, path, rounds):
+    timings = []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            started = time.perf_counter()
+            count = ingest(path, os.path.join(temp_dir, "steam_data.db"))
+            timings.append(time.perf_counter() - started)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tracemalloc.start()
+        try:
+            ingest(path, os.path.join(temp_dir, "steam_data.db"))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    print(f"{label:<10} {count:>8} apps  best {min(timings):6.2f} s  peak {peak / 2**20:7.1f} MB Python allocations")
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the GetAppList ingest")
+    parser.add_argument("fixture", nargs="?", help="recorded GetAppList JSON file (generated into a temp dir when omitted)")
+    parser.add_argument("--write-fixture", metavar="PATH", help="only write a generated fixture to PATH")
+    parser.add_argument("--apps", type=int, default=250000, help="apps in a generated fixture")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--no-baseline", action="store_true", help="skip the old per-row insert path")
+    args = parser.parse_args()
+
+    if args.write_fixture:
+        print(f"Wrote {write_fixture(args.write_fixture, args.apps)} apps to {args.write_fixture}")
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = args.fixture
+        if not path:
+            path = os.path.join(temp_dir, "applist.json")
+            write_fixture(path, args.apps)
+        print(f"Fixture: {path} ({os.path.getsize(path) / 2**20:.1f} MB)")
+
+        streamed = measure("streamed", ingest_streamed, path, args.rounds)
+        time_search_index(path)
+        if not args.no_baseline:
+            baseline = measure("baseline", ingest_baseline, path, args.rounds)
+            if baseline != streamed:
+                sys.exit(f"Row count mismatch: streamed {streamed}, baseline {baseline}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.achievements import iter_steamdb_achievements, iter_steamcommunity_achievements
+from src.core.dlc_gen import parse_steamdb_dlcs
+
+# Checks that every installed HTML backend gives the same results as bs4 with html.parser on
+# the page fixtures, then times each backend on pages scaled up to a realistic size by
+# repeating the fixture rows (between the <!-- rows --> markers).
+#
+#   python tools/bench_parsers.py --scale 150
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = {
+    "steamdb_stats.html": lambda markup, backend: list(iter_steamdb_achievements(markup, backend)),
+    "steamcommunity_achievements.html": lambda markup, backend: list(iter_steamcommunity_achievements(markup, backend)),
+    "steamdb_dlc.html": parse_steamdb_dlcs,
+}
+REFERENCE_BACKEND = "html.parser"
+
+def available_backends():
+    backends = [REFERENCE_BACKEND]
+    try:
+        import lxml  # noqa: F401
+        backends.append("lxml")
+    except ImportError:
+        pass
+    try:
+        import selectolax.lexbor  # noqa: F401
+        backends.append("selectolax")
+    except ImportError:
+        pass
+    return backends
+
+def scale_page(markup, scale):
+    start = markup.index(b"<!-- rows -->")
+    end = markup.index(b"<!-- /rows -->")
+    return markup[:start] + markup[start:end] * scale + markup[end:]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare and benchmark the HTML parser backends")
+    parser.add_argument("--scale", type=int, default=150, help="row repetitions for the timed pages")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    backends = available_backends()
+    print(f"Backends: {', '.join(backends)}")
+    mismatches = 0
+
+    for page, parse in PAGES.items():
+        with open(os.path.join(FIXTURE_DIR, page), 'rb') as f:
+            markup = f.read()
+
+        reference = parse(markup, REFERENCE_BACKEND)
+        for backend in backends[1:]:
+            if (result := parse(markup, backend)) != reference:
+                mismatches += 1
+                print(f"MISMATCH {page} {backend}:\n  {REFERENCE_BACKEND}: {reference}\n  {backend}: {result}")
+
+        scaled = scale_page(markup, args.scale)
+        print(f"\n{page}: {len(reference)} results, timed at x{args.scale} ({len(scaled) / 1024:.0f} KB)")
+        for backend in backends:
+            timings = []
+            for _ in range(args.rounds):
+                started = time.perf_counter()
+                parse(scaled, backend)
+                timings.append(time.perf_counter() - started)
+            print(f"  {backend:<12} best {min(timings) * 1000:8.1f} ms")
+
+    if mismatches:
+        sys.exit(f"\n{mismatches} backend result(s) differ from {REFERENCE_BACKEND}")
+    print("\nAll backends returned identical results.")
+
+if __name__ == "__main__":
+    main()
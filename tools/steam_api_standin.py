@@ -0,0 +1,168 @@
+import sys
+import json
+import hashlib
+import time
+import random
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Offline stand-in for the Steam Web API endpoints the app index and the achievement schema source talk to:
+#   ISteamApps/GetAppList/v0002   full list, no key
+#   IStoreService/GetAppList/v1   paged by last_appid/max_results, filtered by if_modified_since and app type
+#   ISteamUserStats/GetSchemaForGame/v2   generated achievement schema per appid and language "l", needs a key
+#
+#   python tools/steam_api_standin.py --apps 50000
+#   GSE_STEAM_API_URL=http://127.0.0.1:8080 python main.py
+#
+# POST /rename?appid=<id>&name=<name>[&type=dlc] adds or renames an app and marks it modified now,
+# the next keyed refresh should pick up exactly that change.
+
+ICON_CDN = "https://cdn.fastly.steamstatic.com/steamcommunity/public/images/apps"
+TYPE_PARAMS = {"game": "include_games", "dlc": "include_dlc", "application": "include_software"}
+MAX_PAGE_SIZE = 50000
+DEFAULT_PAGE_SIZE = 10000
+
+class AppStore:
+    def __init__(self, apps):
+        self.apps = apps    # {appid: {"name", "type", "last_modified"}}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def generate(cls, count, seed=0):
+        rng = random.Random(seed)
+        now = int(time.time())
+        apps = {}
+        appid = 0
+        for number in range(count):
+            appid += rng.choice((10, 10, 20, 30, 70))
+            app_type = rng.choices(("game", "dlc", "application"), (6, 3, 1))[0]
+            # GetAppList lists quite a few apps without a name
+            name = "" if rng.random() < 0.05 else f"{app_type.title()} {number} {rng.choice(('Deluxe Edition', 'Remastered', 'Soundtrack', ''))}".strip()
+            apps[appid] = {"name": name, "type": app_type, "last_modified": now - rng.randrange(365 * 24 * 60 * 60)}
+        return cls(apps)
+
+    # A recorded ISteamApps/GetAppList document, apps without type info count as games
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls({app['appid']: {"name": app['name'], "type": app.get('type', "game"), "last_modified": app.get('last_modified', 0)} for app in data['applist']['apps']})
+
+    def rename(self, appid, name, app_type=None):
+        with self.lock:
+            app = self.apps.setdefault(appid, {"name": name, "type": app_type or "game"})
+            app.update(name=name, last_modified=int(time.time()))
+            if app_type:
+                app['type'] = app_type
+
+    def app_list(self):
+        with self.lock:
+            return {"applist": {"apps": [{"appid": appid, "name": app['name']} for appid, app in sorted(self.apps.items())]}}
+
+    def store_page(self, params):
+        types = {app_type for app_type, param in TYPE_PARAMS.items() if params.get(param, "true" if app_type == "game" else "false") == "true"}
+        since = int(params.get('if_modified_since', 0))
+        last_appid = int(params.get('last_appid', 0))
+        max_results = min(int(params.get('max_results', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+
+        with self.lock:
+            matches = [(appid, app) for appid, app in sorted(self.apps.items()) if appid > last_appid and app['type'] in types and app['last_modified'] > since]
+        page = matches[:max_results]
+        response = {"apps": [{"appid": appid, "name": app['name'], "last_modified": app['last_modified'], "price_change_number": 0} for appid, app in page]}
+        if len(matches) > max_results:
+            response.update(have_more_results=True, last_appid=page[-1][0])
+        return {"response": response}
+
+# Shaped like the real response: API names, full icon URLs, hidden entries, and several tiers sharing one icon
+def achievement_schema(appid, language="english", count=40):
+    rng = random.Random(appid)
+    achievements = []
+    for number in range(count):
+        tier = number % 4
+        icon = hashlib.sha1(f"{appid}:{number - tier}".encode()).hexdigest()
+        hidden = int(rng.random() < 0.2)
+        achievements.append({
+            "name": f"ACH_{number // 4}_TIER_{tier + 1}",
+            "defaultvalue": 0,
+            "displayName": f"[{language}] Achievement {number // 4} tier {tier + 1}",
+            "hidden": hidden,
+            "description": f"[{language}] Description {number}",
+            "icon": f"{ICON_CDN}/{appid}/{icon}.jpg",
+            "icongray": f"{ICON_CDN}/{appid}/{icon}_gray.jpg"
+        })
+    return {"game": {"gameName": f"Game {appid}", "gameVersion": "1", "availableGameStats": {"achievements": achievements}}}
+
+class Handler(BaseHTTPRequestHandler):
+    store = None
+
+    def _send_json(self, data, status=200):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        path = url.path.rstrip('/')
+
+        if path == "/ISteamApps/GetAppList/v0002":
+            self._send_json(self.store.app_list())
+        elif path == "/IStoreService/GetAppList/v1":
+            if not params.get('key'):
+                self._send_json({"error": "key required"}, 403)
+            else:
+                self._send_json(self.store.store_page(params))
+        elif path == "/ISteamUserStats/GetSchemaForGame/v2":
+            if not params.get('key'):
+                self._send_json({"error": "key required"}, 403)
+            elif not params.get('appid', "").isdigit():
+                self._send_json({"error": "appid required"}, 400)
+            else:
+                self._send_json(achievement_schema(int(params['appid']), params.get('l', "english")))
+        else:
+            self._send_json({"error": "not found"}, 404)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        if url.path.rstrip('/') != "/rename" or 'appid' not in params or 'name' not in params:
+            self._send_json({"error": "expected /rename?appid=<id>&name=<name>"}, 400)
+            return
+        self.store.rename(int(params['appid']), params['name'], params.get('type'))
+        self._send_json({"ok": True})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            sys.stderr.write(f"{self.command} {self.path}\n")
+
+def serve(store, host="127.0.0.1", port=8080, verbose=False):
+    handler = type("StandinHandler", (Handler,), {"store": store})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.verbose = verbose
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline stand-in for the Steam Web API app list and achievement schema endpoints")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--apps", type=int, default=50000, help="number of generated apps")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixture", help="serve a recorded ISteamApps/GetAppList JSON file instead")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    store = AppStore.load(args.fixture) if args.fixture else AppStore.generate(args.apps, args.seed)
+    server = serve(store, args.host, args.port, args.verbose)
+    print(f"Serving {len(store.apps)} apps on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()